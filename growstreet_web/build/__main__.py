@@ -0,0 +1,43 @@
+#Pasos de build que se corren antes de `reflex run` / `reflex export`.
+#
+#Uso:
+#   python -m growstreet_web.build            -> corre todos los pasos
+#   python -m growstreet_web.build images     -> corre solo los pasos indicados
+import sys
+
+from growstreet_web.build import benchmark, images, layout_report, precompress, routes, static_export
+from growstreet_web.catalog.queries import seed_catalog
+from growstreet_web.feeding import dosage
+from growstreet_web.growlog.queries import create_tables
+from growstreet_web.guides import search_index
+
+STEPS = {
+    "images": images.main,
+    "catalog": seed_catalog,
+    "growlog": create_tables,
+    "guias": search_index.main,
+    "dosis": dosage.main,
+    "layout": layout_report.main,
+    "routes": routes.main,
+}
+
+#Pasos que usan la salida de `reflex export`, no se corren por defecto
+POST_EXPORT_STEPS = {
+    "static": static_export.main,
+    "http": precompress.main,
+    "bench": benchmark.main,
+}
+
+
+def main(argv: list[str]):
+    steps = {**STEPS, **POST_EXPORT_STEPS}
+    names = argv or list(STEPS)
+    unknown = [name for name in names if name not in steps]
+    if unknown:
+        sys.exit(f"Pasos desconocidos: {', '.join(unknown)}. Disponibles: {', '.join(steps)}")
+    for name in names:
+        steps[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,200 @@
+#Benchmark de arranque y tamaño: tiempo de import por modulo, tiempo de
+#compilacion por pagina, bytes de JS/CSS y de imagenes por ruta y memoria
+#maxima. Guarda los resultados en JSON y falla si se pasa algun limite de
+#budgets.json.
+#
+#Uso:
+#   python -m growstreet_web.build bench
+#   (despues de `reflex export` tambien mide el JS/CSS de cada ruta)
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import reflex as rx
+from reflex.components.component import CustomComponent
+from reflex.utils import prerequisites
+
+from growstreet_web.build.images import ASSETS_DIR
+
+BUDGETS_PATH = Path(__file__).with_name("budgets.json")
+RESULTS_FILE = "benchmark.json"
+APP_MODULE = "growstreet_web.growstreet_web"
+PACKAGE = "growstreet_web"
+
+
+def import_times(module: str = APP_MODULE) -> dict[str, float]:
+    #Proceso nuevo para medir el import en frio (segundos acumulados por modulo)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name.startswith(PACKAGE) and cumulative.strip().isdigit():
+            times[name] = int(cumulative) / 1_000_000
+    return times
+
+
+def loaded_modules(module: str) -> list[str]:
+    #Modulos del paquete que arrastra el import (ej: un estilo que importa vistas)
+    code = (
+        f"import sys, {module}; "
+        f"print('\\n'.join(sorted(m for m in sys.modules if m.startswith('{PACKAGE}.'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return [
+        name for name in result.stdout.split()
+        if name != module and not module.startswith(name + ".")
+    ]
+
+
+def compile_times(app: rx.App) -> dict[str, float]:
+    from reflex.compiler import compiler
+
+    times = {}
+    for route, component in app.pages.items():
+        start = time.perf_counter()
+        component._add_style_recursive(app.style, app.theme)
+        compiler.compile_page(route, component, app.state)
+        times[route] = time.perf_counter() - start
+    return times
+
+
+def _children(component: rx.Component) -> list[rx.Component]:
+    children = [child for child in component.children if isinstance(child, rx.Component)]
+    if isinstance(component, CustomComponent):
+        children.append(component.get_component(component))
+    return children
+
+
+def _image_sources(component: rx.Component) -> list[str]:
+    sources = []
+    if component.tag == "img":
+        src = getattr(component, "src", None)
+        #Solo rutas fijas, las que vienen del estado no se conocen al compilar
+        if src is not None and src._var_is_local:
+            sources.append(src._var_name)
+    for child in _children(component):
+        sources.extend(_image_sources(child))
+    return sources
+
+
+def asset_bytes(app: rx.App) -> dict[str, int]:
+    sizes = {}
+    for route, component in app.pages.items():
+        total = 0
+        for src in set(_image_sources(component)):
+            path = ASSETS_DIR / src.lstrip("/")
+            if path.exists():
+                total += path.stat().st_size
+        sizes[route] = total
+    return sizes
+
+
+def bundle_bytes() -> dict[str, int] | None:
+    #Usa el build-manifest de Next.js que queda despues de `reflex export`
+    next_dir = prerequisites.get_web_dir() / ".next"
+    manifest_path = next_dir / "build-manifest.json"
+    if not manifest_path.exists():
+        return None
+    manifest = json.loads(manifest_path.read_text())
+    pages = manifest["pages"]
+    shared = set(pages.get("/_app", []))
+
+    sizes = {}
+    for page, files in pages.items():
+        if page.startswith("/_"):
+            continue
+        route = page.strip("/") or "index"
+        sizes[route] = sum(
+            (next_dir / name).stat().st_size
+            for name in shared | set(files)
+            if (next_dir / name).exists()
+        )
+    return sizes
+
+
+def peak_memory_mb() -> float:
+    #ru_maxrss esta en KB en Linux y en bytes en macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_benchmark() -> dict:
+    imports = import_times()
+
+    start = time.perf_counter()
+    from growstreet_web.growstreet_web import app
+    app_import = time.perf_counter() - start
+
+    budgets = json.loads(BUDGETS_PATH.read_text())
+    return dict(
+        import_seconds = imports,
+        app_import_seconds = app_import,
+        modules_loaded_by = {
+            module: loaded_modules(module)
+            for module in budgets.get("max_modules_loaded_by", {})
+        },
+        compile_seconds = compile_times(app),
+        asset_bytes = asset_bytes(app),
+        bundle_bytes = bundle_bytes(),
+        peak_memory_mb = peak_memory_mb(),
+    )
+
+
+def check_budgets(results: dict, budgets: dict) -> list[str]:
+    errors = []
+
+    for module, limit in budgets.get("import_seconds", {}).items():
+        value = results["import_seconds"].get(module)
+        if value is not None and value > limit:
+            errors.append(f"import de {module}: {value:.3f}s > {limit}s")
+
+    for module, limit in budgets.get("max_modules_loaded_by", {}).items():
+        modules = results["modules_loaded_by"][module]
+        if len(modules) > limit:
+            errors.append(f"{module} importa {len(modules)} modulos del paquete (max {limit}): {', '.join(modules)}")
+
+    for key, label in (
+        ("compile_seconds", "compilacion"),
+        ("asset_bytes", "imagenes"),
+        ("bundle_bytes", "JS/CSS"),
+    ):
+        limit = budgets.get(f"{key}_per_route")
+        for route, value in (results[key] or {}).items():
+            if limit is not None and value > limit:
+                errors.append(f"{label} de /{route}: {value} > {limit}")
+
+    limit = budgets.get("peak_memory_mb")
+    if limit is not None and results["peak_memory_mb"] > limit:
+        errors.append(f"memoria maxima: {results['peak_memory_mb']:.0f}MB > {limit}MB")
+
+    return errors
+
+
+def main():
+    results = run_benchmark()
+    output = Path(RESULTS_FILE)
+    output.write_text(json.dumps(results, indent=1, sort_keys=True))
+    print(f"bench: resultados en {output}")
+
+    errors = check_budgets(results, json.loads(BUDGETS_PATH.read_text()))
+    for error in errors:
+        print(f"bench: {error}")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#Cache de compilacion: guarda un hash por pagina (arbol de componentes) y uno
+#compartido (estilos, estado, componentes memo, dependencias). Solo se vuelven
+#a escribir las paginas que cambiaron, y si nada cambio (ej: los workers del
+#backend que importan la app despues de que `reflex run` ya compilo) no se
+#compila nada.
+import hashlib
+import json
+import os
+import re
+
+import reflex as rx
+from reflex import constants
+from reflex.compiler import compiler
+from reflex.compiler import utils as compiler_utils
+from reflex.config import get_config
+from reflex.components.component import evaluate_style_namespaces
+from reflex.utils import console, prerequisites
+
+from growstreet_web.styles import atomic
+
+CACHE_FILE = "growstreet_compile_cache.json"
+
+#rx.foreach genera un nombre de indice al azar en cada import
+_FOREACH_INDEX = re.compile(r"index_[0-9a-f]{16}")
+
+
+def _digest(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(_FOREACH_INDEX.sub("index", str(part)).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _imports(component: rx.Component) -> list:
+    return sorted(
+        (library, sorted(str(var) for var in import_vars))
+        for library, import_vars in component._get_all_imports().items()
+    )
+
+
+def page_fingerprint(component: rx.Component) -> str:
+    return _digest(
+        repr(component),
+        _imports(component),
+        sorted(component._get_all_custom_code()),
+        list(component._get_all_hooks()),
+    )
+
+
+def shared_fingerprint(app: rx.App, export: bool) -> str:
+    custom_components = {}
+    libraries = set()
+    app_wrappers = {}
+    for component in app.pages.values():
+        for custom in component._get_all_custom_components():
+            custom_components[custom.tag] = repr(custom.get_component(custom))
+        libraries.update(component._get_all_imports())
+        #Los componentes de _app.js (ej: la navbar y el footer de components/layout.py)
+        for key, wrapper in component._get_all_app_wrap_components().items():
+            app_wrappers[str(key)] = (repr(wrapper), sorted(wrapper._get_all_custom_code()))
+
+    return _digest(
+        constants.Reflex.VERSION,
+        export,
+        repr(app.style),
+        app.stylesheets,
+        [repr(head) for head in app.head_components],
+        repr(app.theme),
+        app.html_lang,
+        app.html_custom_attrs,
+        get_config().tailwind,
+        #Estado inicial (cambia si cambian las vars del estado)
+        _initial_state(app),
+        sorted(custom_components.items()),
+        sorted(app_wrappers.items()),
+        #Una libreria nueva obliga a instalar paquetes del frontend
+        sorted(libraries),
+    )
+
+
+def _initial_state(app: rx.App) -> str | None:
+    if app.state is None:
+        return None
+    return json.dumps(compiler_utils.compile_state(app.state), sort_keys=True, default=str)
+
+
+def fingerprint(app: rx.App, export: bool) -> dict:
+    return dict(
+        shared = shared_fingerprint(app, export),
+        pages = {
+            route: page_fingerprint(component)
+            for route, component in app.pages.items()
+        },
+    )
+
+
+def _cache_path():
+    return prerequisites.get_web_dir() / CACHE_FILE
+
+
+def load() -> dict | None:
+    path = _cache_path()
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except ValueError:
+        return None
+
+
+def save(data: dict):
+    path = _cache_path()
+    if not path.parent.exists():
+        return
+    #Se escribe en un temporal y se reemplaza para que dos workers no lean un archivo a medias
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def changed_pages(previous: dict | None, current: dict) -> list[str] | None:
+    #None significa que hay que compilar todo
+    if previous is None or previous["shared"] != current["shared"]:
+        return None
+    if previous["pages"].keys() != current["pages"].keys():
+        return None
+    if not all(
+        os.path.exists(compiler_utils.get_page_path(route))
+        for route in current["pages"]
+    ):
+        return None
+    return [
+        route
+        for route, digest in current["pages"].items()
+        if previous["pages"][route] != digest
+    ]
+
+
+class CachedApp(rx.App):
+
+    def _compile(self, export: bool = False):
+        #Igual que rx.App._compile antes de decidir si compilar
+        if constants.Page404.SLUG not in self.pages:
+            self.add_custom_404_page()
+        self._add_optional_endpoints()
+        if not self._should_compile():
+            return
+
+        #Las clases de atomic() se registran al crear las paginas, el archivo se
+        #escribe antes de compilar porque reflex verifica que exista en assets/
+        web_public = prerequisites.get_web_dir() / constants.Dirs.PUBLIC
+        atomic.write_stylesheet(*([web_public] if web_public.exists() else []))
+
+        current = fingerprint(self, export)
+        changed = changed_pages(load(), current)
+
+        if changed is None:
+            super()._compile(export = export)
+        elif changed:
+            console.info(f"Compilando {len(changed)} pagina(s) modificada(s): {', '.join(changed)}")
+            self._compile_pages(changed)
+        else:
+            console.info("Compilacion al dia, no hay paginas modificadas")
+
+        save(current)
+
+    def _compile_pages(self, routes: list[str]):
+        #Mismos pasos previos que rx.App._compile, pero escribiendo solo las paginas indicadas
+        self._validate_var_dependencies()
+        self._setup_overlay_component()
+        self._setup_error_boundary()
+        self.style = evaluate_style_namespaces(self.style)
+        for component in self.pages.values():
+            component._add_style_recursive(self.style, self.theme)
+
+        #Los componentes con estado se comparten entre paginas en un solo archivo,
+        #por eso se calculan con todas las paginas
+        stateful_path, stateful_code, page_components = compiler.compile_stateful_components(
+            self.pages.values()
+        )
+        compiler_utils.write_page(stateful_path, stateful_code)
+
+        by_route = dict(zip(self.pages, page_components))
+        for route in routes:
+            output_path, code = compiler.compile_page(route, by_route[route], self.state)
+            compiler_utils.write_page(output_path, code)
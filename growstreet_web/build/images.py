@@ -0,0 +1,191 @@
+#Pipeline de imagenes: genera versiones redimensionadas (AVIF/WebP/PNG) de
+#las imagenes de assets/ con un hash de contenido en el nombre, y un
+#manifest.json que usa el componente optimized_image para armar srcset/sizes
+#y el placeholder borroso que se muestra mientras carga.
+#
+#Uso: python -m growstreet_web.build images
+import base64
+import hashlib
+import io
+import json
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+OUTPUT_DIR = ASSETS_DIR / "optimized"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+#Anchos (en px) que se generan para cada imagen
+WIDTHS = (64, 128, 256, 512, 1024, 2048)
+
+#Formatos modernos en orden de preferencia para el navegador
+FORMATS = ("avif", "webp")
+
+#Formato de respaldo segun la imagen original (<img src> dentro del <picture>)
+FALLBACK_FORMATS = {
+    ".png": "png",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+}
+
+MIME_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+}
+
+#Carpetas de assets que no son imagenes del sitio
+EXCLUDED_DIRS = {"optimized", "colorpalette"}
+
+SAVE_OPTIONS = {
+    "avif": dict(quality=55),
+    "webp": dict(quality=80, method=6),
+    "png": dict(optimize=True),
+    "jpeg": dict(quality=82, optimize=True, progressive=True),
+}
+
+
+#Placeholder: version minima y borrosa, va dentro del HTML como data URI
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_BLUR = 1
+PLACEHOLDER_OPTIONS = dict(quality=40)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def load_manifest() -> dict:
+    if not MANIFEST_PATH.exists():
+        return {}
+    return json.loads(MANIFEST_PATH.read_text())
+
+
+def _source_images() -> list[Path]:
+    sources = []
+    for path in sorted(ASSETS_DIR.rglob("*")):
+        relative = path.relative_to(ASSETS_DIR)
+        if relative.parts[0] in EXCLUDED_DIRS:
+            continue
+        if path.is_file() and path.suffix.lower() in FALLBACK_FORMATS:
+            sources.append(path)
+    return sources
+
+
+def _available_formats() -> tuple[str, ...]:
+    from PIL import features
+
+    #AVIF depende de como se compilo Pillow, si no esta se omite
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+
+def _target_widths(original_width: int) -> list[int]:
+    widths = [w for w in WIDTHS if w < original_width]
+    widths.append(min(original_width, WIDTHS[-1]))
+    return widths
+
+
+def _entry_is_fresh(entry: dict | None, digest: str) -> bool:
+    if entry is None or entry["hash"] != digest or "placeholder" not in entry:
+        return False
+    return all(
+        (ASSETS_DIR / src.lstrip("/")).exists()
+        for variants in entry["variants"].values()
+        for _, src in variants
+    )
+
+
+def _remove_variants(entry: dict):
+    for variants in entry["variants"].values():
+        for _, src in variants:
+            (ASSETS_DIR / src.lstrip("/")).unlink(missing_ok=True)
+
+
+def _placeholder(image) -> str | None:
+    from PIL import ImageFilter
+
+    #Con transparencia el fondo se veria detras de la imagen ya cargada
+    if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] < 255:
+        return None
+    width, height = image.size
+    tiny = image.convert("RGB").resize(
+        (PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width)))
+    ).filter(ImageFilter.GaussianBlur(PLACEHOLDER_BLUR))
+    buffer = io.BytesIO()
+    tiny.save(buffer, format="WEBP", **PLACEHOLDER_OPTIONS)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def _build_entry(source: Path, digest: str, formats: tuple[str, ...]) -> dict:
+    from PIL import Image
+
+    relative = source.relative_to(ASSETS_DIR)
+    fallback = FALLBACK_FORMATS[source.suffix.lower()]
+    formats = (*formats, fallback)
+    out_dir = OUTPUT_DIR / relative.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source) as image:
+        image.load()
+        width, height = image.size
+        #JPEG no soporta transparencia
+        image = image.convert("RGB" if fallback == "jpeg" else "RGBA")
+        placeholder = _placeholder(image)
+
+        variants = {fmt: [] for fmt in formats}
+        for target in _target_widths(width):
+            resized = image.resize(
+                (target, max(1, round(height * target / width))),
+                Image.Resampling.LANCZOS,
+            )
+            for fmt in formats:
+                name = f"{relative.stem}-{target}.{digest}.{fmt}"
+                resized.save(out_dir / name, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+                url = "/" + (out_dir / name).relative_to(ASSETS_DIR).as_posix()
+                variants[fmt].append([target, url])
+
+    return dict(
+        hash = digest,
+        width = width,
+        height = height,
+        fallback = fallback,
+        placeholder = placeholder,
+        variants = variants,
+    )
+
+
+def build_images() -> dict:
+    formats = _available_formats()
+    previous = load_manifest()
+    manifest = {}
+
+    for source in _source_images():
+        key = source.relative_to(ASSETS_DIR).as_posix()
+        digest = content_hash(source.read_bytes())
+        entry = previous.get(key)
+
+        if _entry_is_fresh(entry, digest):
+            manifest[key] = entry
+            continue
+
+        #La imagen cambio: se borran las variantes viejas
+        if entry is not None:
+            _remove_variants(entry)
+        manifest[key] = _build_entry(source, digest, formats)
+        print(f"images: {key} -> {sum(map(len, manifest[key]['variants'].values()))} variantes")
+
+    #Imagenes que ya no existen en assets/
+    for key in previous.keys() - manifest.keys():
+        _remove_variants(previous[key])
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    return manifest
+
+
+def main():
+    build_images()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#Reporte de cuantos bytes de JSX ahorra cada componente compartido (rx.memo)
+#por pagina: la pagina solo lleva <Links/> en lugar de todo el arbol. La navbar
+#y el footer (app_shell) no van en ninguna pagina, estan una vez en _app.js.
+#
+#Uso: python -m growstreet_web.build layout
+import json
+
+import reflex as rx
+from reflex.components.component import CustomComponent
+from reflex.utils import prerequisites
+
+from growstreet_web.components.layout import AppShell
+
+REPORT_FILE = "layout_report.json"
+
+
+def _shared_components(component: rx.Component) -> list[rx.Component]:
+    found = []
+    if isinstance(component, (CustomComponent, AppShell)):
+        found.append(component)
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            found.extend(_shared_components(child))
+    return found
+
+
+def _saved_bytes(shared: rx.Component) -> int:
+    if isinstance(shared, AppShell):
+        return sum(len(str(wrapper).encode()) for wrapper in shared._get_app_wrap_components().values())
+    inline = str(shared.get_component(shared))
+    #Los memo anidados tambien se hubieran copiado en la pagina
+    nested = sum(_saved_bytes(child) for child in _shared_components(shared.get_component(shared)))
+    return len(inline.encode()) + nested - len(str(shared).encode())
+
+
+def layout_report(app: rx.App) -> dict:
+    report = {}
+    for route, page in app.pages.items():
+        saved = {}
+        for shared in _shared_components(page):
+            name = type(shared).__name__ if isinstance(shared, AppShell) else shared.tag
+            saved[name] = saved.get(name, 0) + _saved_bytes(shared)
+        report[route] = saved
+    return report
+
+
+def main():
+    from growstreet_web.growstreet_web import app
+
+    report = layout_report(app)
+    for route, saved in report.items():
+        print(f"/{route}: {sum(saved.values())} bytes ahorrados")
+        for tag, size in sorted(saved.items()):
+            print(f"    {tag}: {size} bytes")
+
+    web_dir = prerequisites.get_web_dir()
+    if web_dir.exists():
+        (web_dir / REPORT_FILE).write_text(json.dumps(report, indent=1, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
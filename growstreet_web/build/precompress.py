@@ -0,0 +1,92 @@
+#Prepara el export del frontend para servirlo con cache HTTP
+#(growstreet_web/serving/static_files.py): guarda versiones .gz y .br de los
+#archivos de texto y un manifest con el ETag (hash del contenido) de cada
+#archivo, asi el servidor no comprime ni calcula hashes en cada request.
+#
+#Uso:
+#   reflex export --frontend-only --no-zip
+#   python -m growstreet_web.build static http
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from reflex import constants
+from reflex.utils import prerequisites
+
+from growstreet_web.build.static_export import OUTPUT_DIR as STATIC_HTML_DIR
+from growstreet_web.serving.static_files import ENCODINGS, TEXT_SUFFIXES, manifest_path
+
+#Archivos mas chicos no ganan nada comprimidos
+MIN_SIZE = 256
+
+_COMPRESSED_SUFFIXES = {suffix for _, suffix in ENCODINGS}
+
+
+def _compressors() -> dict:
+    compressors = {"gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    #brotli es opcional, si no esta instalado solo se genera gzip
+    try:
+        import brotli
+    except ImportError:
+        return compressors
+    return {"br": lambda data: brotli.compress(data, quality=11), **compressors}
+
+
+def _files(root: Path) -> list[Path]:
+    return [
+        path for path in sorted(root.rglob("*"))
+        if path.is_file() and path.suffix not in _COMPRESSED_SUFFIXES
+    ]
+
+
+def precompress(root: Path) -> dict:
+    compressors = _compressors()
+    suffixes = dict(ENCODINGS)
+    previous = {}
+    if manifest_path(root).exists():
+        previous = json.loads(manifest_path(root).read_text())
+
+    manifest = {}
+    for path in _files(root):
+        data = path.read_bytes()
+        etag = hashlib.sha256(data).hexdigest()[:20]
+        relative = path.relative_to(root).as_posix()
+        encodings = []
+
+        if path.suffix in TEXT_SUFFIXES and len(data) >= MIN_SIZE:
+            #Si el contenido no cambio y los comprimidos siguen ahi no se vuelven a generar
+            entry = previous.get(relative)
+            for name, compress in compressors.items():
+                target = path.with_name(path.name + suffixes[name])
+                if not (entry and entry["etag"] == etag and name in entry["encodings"] and target.exists()):
+                    compressed = compress(data)
+                    #Se descarta si no achica el archivo
+                    if len(compressed) >= len(data):
+                        target.unlink(missing_ok=True)
+                        continue
+                    target.write_bytes(compressed)
+                encodings.append(name)
+
+        manifest[relative] = dict(etag = etag, encodings = encodings)
+
+    manifest_path(root).write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    return manifest
+
+
+def main():
+    web_dir = prerequisites.get_web_dir()
+    export_dir = web_dir / constants.Dirs.STATIC
+    if not export_dir.exists():
+        print(f"http: no existe {export_dir}, correr antes `reflex export --frontend-only --no-zip`")
+        return
+    #Tambien las paginas sin JavaScript del paso "static", si se corrio
+    roots = [root for root in (export_dir, web_dir / STATIC_HTML_DIR) if root.exists()]
+    for root in roots:
+        manifest = precompress(root)
+        compressed = sum(1 for entry in manifest.values() if entry["encodings"])
+        print(f"http: {root}: {len(manifest)} archivos, {compressed} precomprimidos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#Manifest de rutas y sitemap. El manifest (assets/generated/routes.json) indica
+#por cada ruta si es estatica y que archivos generados descarga al montarse
+#(ej: /guias descarga el indice de busqueda), asi los links de la navbar
+#(components/prefetch_link.js) precargan el codigo y los datos de la pagina de
+#destino. El sitemap (assets/sitemap.xml) lista todas las paginas publicas.
+#
+#Uso: python -m growstreet_web.build routes
+import json
+from xml.sax.saxutils import escape
+
+import reflex as rx
+from reflex import constants
+from reflex.components.component import CustomComponent
+from reflex.config import get_config
+from reflex.vars import Var
+
+from growstreet_web.build.images import ASSETS_DIR
+from growstreet_web.build.static_export import is_state_free
+
+ROUTES_PATH = ASSETS_DIR / "generated" / "routes.json"
+ROUTES_URL = "/generated/routes.json"
+SITEMAP_PATH = ASSETS_DIR / "sitemap.xml"
+
+#Los archivos que generan los pasos del build se sirven desde aca
+GENERATED_PREFIX = "/generated/"
+
+
+def route_path(route: str) -> str:
+    return "/" if route == constants.PageNames.INDEX_ROUTE else f"/{route}"
+
+
+def prefetch_urls(component: rx.Component) -> list[str]:
+    #Props de los componentes propios que apuntan a un archivo generado (ej: index_url del buscador)
+    urls = set()
+    if type(component).__module__.startswith("growstreet_web.") and component.add_custom_code():
+        for prop in component.get_props():
+            value = getattr(component, prop, None)
+            if isinstance(value, Var) and value._var_is_local and value._var_name.startswith(GENERATED_PREFIX):
+                urls.add(value._var_name)
+    children = [child for child in component.children if isinstance(child, rx.Component)]
+    if isinstance(component, CustomComponent):
+        children.append(component.get_component(component))
+    for child in children:
+        urls.update(prefetch_urls(child))
+    return sorted(urls)
+
+
+def route_manifest(app: rx.App) -> dict:
+    return {
+        route_path(route): dict(
+            static = is_state_free(app, route),
+            prefetch = prefetch_urls(component),
+        )
+        for route, component in app.pages.items()
+        if route != constants.Page404.SLUG
+    }
+
+
+def sitemap(paths: list[str], base_url: str) -> str:
+    #next.config usa trailingSlash, la URL de cada pagina termina en /
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for path in paths:
+        url = base_url.rstrip("/") + (path if path == "/" else f"{path}/")
+        lines.append(f"  <url><loc>{escape(url)}</loc></url>")
+    lines.append("</urlset>")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    from growstreet_web.growstreet_web import app
+
+    manifest = route_manifest(app)
+    ROUTES_PATH.parent.mkdir(parents=True, exist_ok=True)
+    ROUTES_PATH.write_text(json.dumps(manifest, separators=(",", ":")))
+    SITEMAP_PATH.write_text(sitemap(sorted(manifest), get_config().deploy_url))
+    print(f"routes: {len(manifest)} rutas en {ROUTES_PATH.name} y {SITEMAP_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#Export estatico: detecta las paginas que no usan estado ni eventos y deja su
+#HTML pre-renderizado (el que genera `reflex export`) sin JavaScript, para
+#servirlas directo desde nginx o un CDN sin abrir el websocket del backend.
+#Las paginas con estado se siguen sirviendo como siempre.
+#
+#Uso:
+#   reflex export --frontend-only --no-zip
+#   python -m growstreet_web.build static
+import json
+import re
+import shutil
+from pathlib import Path
+
+import reflex as rx
+from reflex import constants
+from reflex.components.component import CustomComponent
+from reflex.utils import prerequisites
+
+OUTPUT_DIR = "_static_html"
+ROUTES_FILE = "routes.json"
+NGINX_FILE = "static_routes.conf"
+
+_SCRIPT = re.compile(r"<script\b[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_SCRIPT_PRELOAD = re.compile(
+    r"<link\b[^>]*\brel=\"(?:preload|modulepreload)\"[^>]*\bas=\"script\"[^>]*/?>"
+    r"|<link\b[^>]*\brel=\"modulepreload\"[^>]*/?>",
+    re.IGNORECASE,
+)
+#Contenido de lazy_section, que sin JavaScript nunca se montaria
+_LAZY_SECTION = re.compile(r"(<div\b[^>]*\bdata-lazy-section\b[^>]*>)<noscript>", re.IGNORECASE)
+_NOSCRIPT_TAG = re.compile(r"<(/?)noscript\b[^>]*>", re.IGNORECASE)
+
+
+def _uses_state(component: rx.Component) -> bool:
+    #Cualquier evento (on_click, on_mount, ...) necesita el runtime de reflex
+    if getattr(component, "event_triggers", None):
+        return True
+    #Componentes propios escritos en React (ej: el buscador de guias) solo funcionan con JavaScript,
+    #salvo los que tambien funcionan sin JavaScript (static_fallback, ej: lazy_section)
+    if (
+        type(component).__module__.startswith("growstreet_web.")
+        and component.add_custom_code()
+        and not getattr(component, "static_fallback", False)
+    ):
+        return True
+    for var in component._get_vars():
+        var_data = var._var_data
+        if var_data is not None and var_data.state:
+            return True
+    #Los componentes rx.memo tienen su contenido aparte de los children
+    if isinstance(component, CustomComponent) and _uses_state(component.get_component(component)):
+        return True
+    return any(
+        _uses_state(child)
+        for child in component.children
+        if isinstance(child, rx.Component)
+    )
+
+
+def is_state_free(app: rx.App, route: str) -> bool:
+    if app.load_events.get(route):
+        return False
+    return not _uses_state(app.pages[route])
+
+
+def split_routes(app: rx.App) -> tuple[list[str], list[str]]:
+    static, dynamic = [], []
+    for route in app.pages:
+        (static if is_state_free(app, route) else dynamic).append(route)
+    return static, dynamic
+
+
+def strip_scripts(html: str) -> str:
+    html = _SCRIPT.sub("", html)
+    return _SCRIPT_PRELOAD.sub("", html)
+
+
+def _closing_noscript(html: str, pos: int) -> re.Match:
+    #El </noscript> propio de la seccion: sus hijos pueden tener otros <noscript> (ej: otra lazy_section adentro)
+    depth = 1
+    for tag in _NOSCRIPT_TAG.finditer(html, pos):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return tag
+    raise ValueError(f"lazy_section sin </noscript> de cierre: {html[pos:pos + 80]!r}")
+
+
+def unwrap_lazy_sections(html: str) -> str:
+    pos = 0
+    while section := _LAZY_SECTION.search(html, pos):
+        close = _closing_noscript(html, section.end())
+        html = html[:section.start()] + section.group(1) + html[section.end():close.start()] + html[close.end():]
+        #Se sigue desde el contenido, asi tambien se desenvuelven las secciones anidadas
+        pos = section.start() + len(section.group(1))
+    return html
+
+
+def _exported_html(export_dir: Path, route: str) -> Path:
+    #next.config usa trailingSlash, cada ruta queda como <ruta>/index.html
+    if route == constants.PageNames.INDEX_ROUTE:
+        return export_dir / "index.html"
+    if route == constants.Page404.SLUG:
+        return export_dir / "404.html"
+    return export_dir / route / "index.html"
+
+
+def _nginx_locations(static: list[str], root: Path) -> str:
+    lines = ["# Generado por python -m growstreet_web.build static"]
+    for route in static:
+        if route == constants.Page404.SLUG:
+            continue
+        path = "/" if route == constants.PageNames.INDEX_ROUTE else f"/{route}/"
+        lines.append(f"location = {path} {{ root {root.resolve()}; try_files {path}index.html =404; }}")
+    return "\n".join(lines) + "\n"
+
+
+def export_static_pages(app: rx.App) -> list[str]:
+    web_dir = prerequisites.get_web_dir()
+    export_dir = web_dir / constants.Dirs.STATIC
+    output_dir = web_dir / OUTPUT_DIR
+
+    if not export_dir.exists():
+        print(f"static: no existe {export_dir}, correr antes `reflex export --frontend-only --no-zip`")
+        return []
+
+    #Reflex agrega la pagina 404 al compilar
+    if constants.Page404.SLUG not in app.pages:
+        app.add_custom_404_page()
+    static, dynamic = split_routes(app)
+
+    shutil.rmtree(output_dir, ignore_errors=True)
+    #CSS, imagenes y demas archivos del export se comparten con las paginas estaticas
+    shutil.copytree(export_dir, output_dir, ignore=shutil.ignore_patterns("*.html", "*.js"))
+
+    for route in static:
+        source = _exported_html(export_dir, route)
+        if not source.exists():
+            continue
+        target = output_dir / source.relative_to(export_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(strip_scripts(unwrap_lazy_sections(source.read_text())))
+        print(f"static: /{route if route != constants.PageNames.INDEX_ROUTE else ''} sin JavaScript")
+
+    (output_dir / ROUTES_FILE).write_text(
+        json.dumps(dict(static = static, dynamic = dynamic), indent=1)
+    )
+    (output_dir / NGINX_FILE).write_text(_nginx_locations(static, output_dir))
+    return static
+
+
+def main():
+    from growstreet_web.growstreet_web import app
+
+    export_static_pages(app)
+
+
+if __name__ == "__main__":
+    main()
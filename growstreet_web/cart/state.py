@@ -0,0 +1,92 @@
+import json
+
+import reflex as rx
+
+from growstreet_web.catalog.queries import products_by_id
+from growstreet_web.state import State
+
+#Cantidad maxima de un producto en el carrito
+MAX_QUANTITY = 99
+
+
+def quantity_limit(stock: int) -> int:
+    #Sin stock (0) el producto no se puede agregar
+    return max(0, min(stock, MAX_QUANTITY))
+
+
+#Carrito: se guarda en el localStorage del navegador como {id: cantidad} y
+#llega con el primer evento de la pagina, sin consultar la base. Los datos
+#del catalogo no se copian al estado, se leen del cache del proceso
+class CartState(State):
+    cart: str = rx.LocalStorage("{}", name = "growstreet_cart", sync = True)
+    #Cambia cuando se corrige una cantidad pedida (ej: mas que el stock) sin que cambie
+    #el carrito, asi los selectores vuelven a mostrar la cantidad real
+    revision: int = 0
+
+    def _items(self) -> dict[str, int]:
+        try:
+            items = json.loads(self.cart)
+        except ValueError:
+            return {}
+        return items if isinstance(items, dict) else {}
+
+    #Los computed vars con cache solo se envian cuando cambia el carrito
+    @rx.var(cache = True)
+    def quantities(self) -> dict[str, int]:
+        products = products_by_id()
+        return {
+            product_id: quantity
+            for product_id, quantity in self._items().items()
+            if product_id.isdigit() and int(product_id) in products
+        }
+
+    @rx.var(cache = True)
+    def lines(self) -> list[dict]:
+        products = products_by_id()
+        return [
+            dict(
+                id = int(product_id),
+                name = products[int(product_id)].name,
+                price = products[int(product_id)].price,
+                quantity = quantity,
+                subtotal = products[int(product_id)].price * quantity,
+            )
+            for product_id, quantity in self.quantities.items()
+        ]
+
+    @rx.var(cache = True)
+    def count(self) -> int:
+        return sum(self.quantities.values())
+
+    @rx.var(cache = True)
+    def total(self) -> int:
+        return sum(line["subtotal"] for line in self.lines)
+
+    def set_quantities(self, changes: dict[str, int]):
+        #Aplica varios cambios en un solo evento (y un solo delta)
+        products = products_by_id()
+        items = self._items()
+        corrected = False
+        for product_id, requested in changes.items():
+            product_id = str(product_id)
+            product = products.get(int(product_id)) if product_id.isdigit() else None
+            if product is None:
+                continue
+            quantity = max(0, min(int(requested), quantity_limit(product.stock)))
+            corrected = corrected or quantity != int(requested)
+            if quantity:
+                items[product_id] = quantity
+            else:
+                items.pop(product_id, None)
+        cart = json.dumps(items, sort_keys = True, separators = (",", ":"))
+        #Si no cambio nada no se marca el estado y no se envia nada
+        if cart != self.cart:
+            self.cart = cart
+        elif corrected:
+            self.revision += 1
+
+    def set_quantity(self, product_id: int, quantity: int):
+        self.set_quantities({str(product_id): quantity})
+
+    def clear(self):
+        self.cart = "{}"
@@ -0,0 +1,25 @@
+import reflex as rx
+import sqlalchemy
+import sqlmodel
+
+
+#Producto del catalogo de la tienda, guardado en la base de datos (rxconfig db_url)
+class Product(rx.Model, table=True):
+    name: str = sqlmodel.Field(unique=True)
+    #Linea del fabricante, ej: "Top Crop"
+    line: str
+    #Etapa de cultivo: veg, bloom o deeper
+    stage: str
+    #Ruta dentro de assets/
+    image: str
+    description: str
+    #Precio en pesos, sin centavos
+    price: int
+    #Unidades disponibles, con 0 no se puede agregar al carrito
+    stock: int = 0
+
+    #Indices compuestos para filtrar por linea/etapa y paginar por id
+    __table_args__ = (
+        sqlalchemy.Index("ix_product_line_stage_id", "line", "stage", "id"),
+        sqlalchemy.Index("ix_product_stage_id", "stage", "id"),
+    )
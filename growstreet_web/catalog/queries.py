@@ -0,0 +1,105 @@
+import json
+import time
+from pathlib import Path
+
+import reflex as rx
+import sqlalchemy
+import sqlmodel
+
+from growstreet_web.catalog.models import Product
+
+SEED_PATH = Path(__file__).with_name("products.json")
+
+#Cantidad de cards por pagina en la tienda
+PAGE_SIZE = 12
+
+#Etapas de cultivo que se pueden filtrar
+STAGES = ("veg", "bloom", "deeper")
+
+#Cada cuanto se vuelven a leer los precios para el carrito
+PRICES_TTL_SECONDS = 300
+
+#Cache del proceso: {id: Product}, se comparte entre todas las sesiones
+_product_cache: dict[int, Product] = {}
+_product_cache_time = 0.0
+
+
+def load_seed() -> list[Product]:
+    return [
+        Product(id = index, **data)
+        for index, data in enumerate(json.loads(SEED_PATH.read_text()), start=1)
+    ]
+
+
+def _page_query(query, line: str, stage: str, after_id: int, limit: int):
+    #Paginacion por cursor (id > after_id): usa los indices (line, stage, id)
+    #y no se vuelve mas lenta en las ultimas paginas como un OFFSET
+    query = query.where(Product.id > after_id)
+    if line:
+        query = query.where(Product.line == line)
+    if stage:
+        query = query.where(Product.stage == stage)
+    return query.order_by(Product.id).limit(limit)
+
+
+def list_products(
+    session: sqlmodel.Session,
+    line: str = "",
+    stage: str = "",
+    after_id: int = 0,
+    limit: int = PAGE_SIZE,
+) -> list[Product]:
+    return list(session.exec(_page_query(sqlmodel.select(Product), line, stage, after_id, limit)).all())
+
+
+def list_product_ids(
+    session: sqlmodel.Session,
+    line: str = "",
+    stage: str = "",
+    after_id: int = 0,
+    limit: int = PAGE_SIZE,
+) -> list[int]:
+    #Solo los ids, los datos de cada producto salen de products_by_id
+    return list(session.exec(_page_query(sqlmodel.select(Product.id), line, stage, after_id, limit)).all())
+
+
+def product_lines(session: sqlmodel.Session) -> list[str]:
+    return list(session.exec(sqlmodel.select(Product.line).distinct().order_by(Product.line)).all())
+
+
+def featured_products(limit: int = 4) -> list[Product]:
+    #Se usa al compilar la pagina principal. Si todavia no se creo la base
+    #(python -m growstreet_web.build catalog) se usan los datos iniciales
+    try:
+        with rx.session() as session:
+            products = list_products(session, limit=limit)
+    except sqlalchemy.exc.OperationalError:
+        products = []
+    return products or load_seed()[:limit]
+
+
+def products_by_id(required_ids: list[int] = ()) -> dict[int, Product]:
+    #El carrito y la tienda solo guardan ids, nombre, precio y stock salen de aca.
+    #Si falta algun id pedido (ej: un producto nuevo) se vuelve a leer antes del TTL
+    global _product_cache, _product_cache_time
+    expired = time.monotonic() - _product_cache_time > PRICES_TTL_SECONDS
+    if expired or any(product_id not in _product_cache for product_id in required_ids):
+        try:
+            with rx.session() as session:
+                products = list(session.exec(sqlmodel.select(Product)).all())
+        except sqlalchemy.exc.OperationalError:
+            products = []
+        _product_cache = {product.id: product for product in products or load_seed()}
+        _product_cache_time = time.monotonic()
+    return _product_cache
+
+
+def seed_catalog():
+    rx.Model.create_all()
+    with rx.session() as session:
+        existing = set(session.exec(sqlmodel.select(Product.name)).all())
+        for product in load_seed():
+            if product.name not in existing:
+                product.id = None
+                session.add(product)
+        session.commit()
@@ -0,0 +1,65 @@
+import reflex as rx
+
+from growstreet_web.catalog import queries
+from growstreet_web.catalog.models import Product
+
+
+#Estado de la grilla de la tienda: solo guarda los ids de la pagina visible,
+#los datos de los productos salen del cache del proceso (products_by_id)
+class CatalogState(rx.State):
+    product_ids: list[int] = []
+    line: str = ""
+    stage: str = ""
+    has_next: bool = False
+    has_previous: bool = False
+
+    #Cursores (ultimo id) de las paginas anteriores, no se envian al navegador
+    _cursors: list[int] = []
+
+    def _load_page(self, after_id: int):
+        with rx.session() as session:
+            #Se pide uno de mas para saber si hay otra pagina
+            page = queries.list_product_ids(
+                session,
+                line = self.line,
+                stage = self.stage,
+                after_id = after_id,
+                limit = queries.PAGE_SIZE + 1,
+            )
+        self.has_next = len(page) > queries.PAGE_SIZE
+        self.product_ids = page[:queries.PAGE_SIZE]
+
+    #Solo se calcula (y se envia) cuando cambian los ids de la pagina
+    @rx.var(cache = True)
+    def products(self) -> list[Product]:
+        products = queries.products_by_id(self.product_ids)
+        return [products[product_id] for product_id in self.product_ids if product_id in products]
+
+    def __getstate__(self):
+        #Los productos no se guardan con la sesion (ej: en redis), se recalculan desde los ids
+        state = super().__getstate__()
+        state["__dict__"].pop(CatalogState.computed_vars["products"]._cache_attr, None)
+        return state
+
+    def load_first_page(self):
+        self._cursors = [0]
+        self.has_previous = False
+        self._load_page(0)
+
+    def next_page(self):
+        if not self.has_next:
+            return
+        self._cursors.append(self.product_ids[-1])
+        self.has_previous = True
+        self._load_page(self._cursors[-1])
+
+    def previous_page(self):
+        if len(self._cursors) < 2:
+            return
+        self._cursors.pop()
+        self.has_previous = len(self._cursors) > 1
+        self._load_page(self._cursors[-1])
+
+    def set_stage(self, stage: str):
+        self.stage = stage
+        self.load_first_page()
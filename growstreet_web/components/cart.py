@@ -0,0 +1,55 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.cart.state import MAX_QUANTITY, CartState
+from growstreet_web.components.cart_stepper import cart_stepper
+
+#Selector de cantidad de un producto (Product o item de rx.foreach)
+def cart_quantity(product) -> rx.Component:
+    return cart_stepper(
+            #id es Optional[int] en el modelo, en JS la clave del objeto es la misma
+            value = CartState.quantities[product.id.to(int)],
+            #Igual que quantity_limit en cart/state.py: sin stock no se puede agregar
+            max = rx.cond(product.stock < MAX_QUANTITY, product.stock, MAX_QUANTITY),
+            revision = CartState.revision,
+            on_change = lambda quantity: CartState.set_quantity(product.id, quantity),
+        )
+
+def cart_line(line: rx.Var) -> rx.Component:
+    return rx.hstack(
+            rx.text(line["quantity"], " x ", line["name"]),
+            rx.text.strong("$ ", line["subtotal"]),
+            justify = "between",
+            width = "100%",
+        )
+
+def cart_summary() -> rx.Component:
+    return rx.card(
+            rx.vstack(
+                rx.heading("Carrito (", CartState.count, ")", size = "4"),
+                rx.cond(
+                    CartState.count > 0,
+                    rx.vstack(
+                        rx.foreach(CartState.lines, cart_line),
+                        rx.divider(),
+                        rx.hstack(
+                            rx.text.strong("Total"),
+                            rx.text.strong("$ ", CartState.total),
+                            justify = "between",
+                            width = "100%",
+                        ),
+                        rx.button(
+                            "Vaciar carrito",
+                            on_click = CartState.clear,
+                            variant = "outline",
+                            color_scheme = "teal",
+                            width = "auto",
+                        ),
+                        width = "100%",
+                    ),
+                    rx.text("Todavia no agregaste productos"),
+                ),
+                width = "100%",
+            ),
+            width = "100%",
+            max_width = styles.MAX_WIDTH,
+        )
@@ -0,0 +1,52 @@
+// Selector de cantidad del carrito: los clicks se acumulan en el navegador y
+// se manda un solo evento con la cantidad final cuando el usuario deja de tocar.
+
+function CartStepper({ value = 0, min = 0, max = 99, delay = 400, revision = 0, onChange }) {
+  const [quantity, setQuantity] = useState(value);
+  const timer = useRef(null);
+  const pending = useRef(false);
+
+  // Cuando llega la cantidad del backend se muestra, salvo que haya un cambio sin enviar.
+  // revision cambia cuando el backend corrige la cantidad pedida sin cambiar el carrito
+  // (ej: mas que el stock), en ese caso value es el mismo pero hay que volver a mostrarlo
+  useEffect(() => {
+    if (!pending.current) {
+      setQuantity(value);
+    }
+  }, [value, revision]);
+
+  useEffect(() => () => clearTimeout(timer.current), []);
+
+  const change = (delta) => {
+    const next = Math.max(min, Math.min(max, quantity + delta));
+    if (next === quantity) {
+      return;
+    }
+    setQuantity(next);
+    pending.current = true;
+    clearTimeout(timer.current);
+    timer.current = setTimeout(() => {
+      pending.current = false;
+      if (onChange) {
+        onChange(next);
+      }
+    }, delay);
+  };
+
+  const buttonStyle = {
+    width: "2em",
+    height: "2em",
+    borderRadius: "0.5em",
+    border: "1px solid #15856C",
+    background: "transparent",
+    cursor: "pointer",
+  };
+
+  return (
+    <span style={{ display: "inline-flex", alignItems: "center", gap: "0.5em" }}>
+      <button type="button" aria-label="Quitar uno" onClick={() => change(-1)} style={buttonStyle}>-</button>
+      <span aria-live="polite" style={{ minWidth: "1.5em", textAlign: "center" }}>{quantity}</span>
+      <button type="button" aria-label="Agregar uno" onClick={() => change(1)} style={buttonStyle}>+</button>
+    </span>
+  );
+}
@@ -0,0 +1,32 @@
+import reflex as rx
+from pathlib import Path
+
+#El componente de React esta en cart_stepper.js y se agrega al codigo de la pagina
+CART_STEPPER_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class CartStepper(rx.Component):
+    tag = "CartStepper"
+
+    value: rx.Var[int]
+
+    max: rx.Var[int]
+
+    #Milisegundos sin clicks antes de mandar la cantidad
+    delay: rx.Var[int]
+
+    #Contador del backend para volver a mostrar value cuando corrige una cantidad
+    revision: rx.Var[int]
+
+    def get_event_triggers(self) -> dict:
+        return {
+            **super().get_event_triggers(),
+            "on_change": lambda quantity: [quantity],
+        }
+
+    def add_imports(self):
+        return {"react": ["useState", "useRef", "useEffect"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [CART_STEPPER_JS]
+
+cart_stepper = CartStepper.create
@@ -0,0 +1,34 @@
+// Ultimas publicaciones de un canal (YouTube, Instagram). Se piden al backend
+// (/api/feed/<canal>), que responde desde su cache sin esperar a la red social.
+// Sin JavaScript o si falla el pedido queda el link al canal.
+
+function FeedList({ feedUrl, channelUrl, label }) {
+  const [items, setItems] = useState([]);
+
+  useEffect(() => {
+    let active = true;
+    fetch(feedUrl)
+      .then((response) => response.json())
+      .then((feed) => { if (active) setItems(feed.items || []); })
+      .catch(() => {});
+    return () => { active = false; };
+  }, [feedUrl]);
+
+  return (
+    <div style={{ width: "100%" }}>
+      <ul style={{ listStyle: "none", padding: 0, margin: 0, display: "flex", flexDirection: "column", gap: "0.5em" }}>
+        {items.map((item) => (
+          <li key={item.url + item.published}>
+            <a href={item.url} target="_blank" rel="noopener noreferrer" style={{ display: "flex", gap: "0.5em", alignItems: "center" }}>
+              {item.thumbnail && (
+                <img src={item.thumbnail} alt="" width="96" height="54" loading="lazy" decoding="async" style={{ objectFit: "cover", borderRadius: "0.25em" }} />
+              )}
+              <span>{item.title}</span>
+            </a>
+          </li>
+        ))}
+      </ul>
+      <a href={channelUrl} target="_blank" rel="noopener noreferrer">{label}</a>
+    </div>
+  );
+}
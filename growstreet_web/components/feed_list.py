@@ -0,0 +1,27 @@
+import reflex as rx
+from pathlib import Path
+from typing import ClassVar
+
+#El componente de React esta en feed_list.js y se agrega al codigo de la pagina
+FEED_LIST_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class FeedList(rx.Component):
+    tag = "FeedList"
+
+    #Endpoint del backend (growstreet_web/feed/api.py)
+    feed_url: rx.Var[str]
+
+    channel_url: rx.Var[str]
+
+    label: rx.Var[str]
+
+    #Sin JavaScript la pagina sigue funcionando, solo queda el link al canal
+    static_fallback: ClassVar[bool] = True
+
+    def add_imports(self):
+        return {"react": ["useState", "useEffect"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [FEED_LIST_JS]
+
+feed_list = FeedList.create
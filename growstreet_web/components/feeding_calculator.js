@@ -0,0 +1,115 @@
+// Calculadora de riego: todo corre en el navegador con la tabla generada por
+// growstreet_web/feeding/dosage.py, mover un slider no manda eventos al backend.
+
+function feedingDoses(table, stage, week, potLiters, plants) {
+  const weeks = table.doses[stage] || [];
+  const row = weeks[Math.min(week, weeks.length) - 1] || [];
+  const liters = potLiters * table.watering_fraction * plants;
+  return {
+    liters,
+    products: table.products.map((name, column) => ({
+      name,
+      mlPerLiter: row[column] || 0,
+      ml: (row[column] || 0) * liters,
+    })),
+  };
+}
+
+function FeedingSlider({ label, value, min, max, step = 1, unit = "", onChange }) {
+  return (
+    <label style={{ display: "block", width: "100%" }}>
+      <span>{label}: <strong>{value}{unit}</strong></span>
+      <input
+        type="range"
+        min={min}
+        max={max}
+        step={step}
+        value={value}
+        onChange={(event) => onChange(Number(event.target.value))}
+        style={{ width: "100%", accentColor: "#15856C" }}
+      />
+    </label>
+  );
+}
+
+function FeedingCalculator({ tableUrl }) {
+  const [table, setTable] = useState(null);
+  const [stage, setStage] = useState("veg");
+  const [week, setWeek] = useState(1);
+  const [potLiters, setPotLiters] = useState(10);
+  const [plants, setPlants] = useState(1);
+
+  useEffect(() => {
+    fetch(tableUrl)
+      .then((response) => response.json())
+      .then(setTable)
+      .catch(() => setTable({ products: [], stages: [], doses: {}, watering_fraction: 0, source: null }));
+  }, [tableUrl]);
+
+  const result = useMemo(
+    () => (table ? feedingDoses(table, stage, week, potLiters, plants) : null),
+    [table, stage, week, potLiters, plants],
+  );
+
+  if (!table) {
+    return <p>Cargando tabla de dosis...</p>;
+  }
+  const stageWeeks = (table.stages.find(([key]) => key === stage) || [stage, stage, 1])[2];
+
+  return (
+    <div style={{ width: "100%", maxWidth: "600px", display: "flex", flexDirection: "column", gap: "1em" }}>
+      <div style={{ display: "flex", gap: "0.5em", flexWrap: "wrap", justifyContent: "center" }}>
+        {table.stages.map(([key, label]) => (
+          <button
+            key={key}
+            type="button"
+            aria-pressed={key === stage}
+            onClick={() => { setStage(key); setWeek(1); }}
+            style={{
+              padding: "0.5em",
+              borderRadius: "0.5em",
+              border: "1px solid #15856C",
+              background: key === stage ? "#15856C" : "transparent",
+              color: key === stage ? "white" : "inherit",
+              cursor: "pointer",
+            }}
+          >
+            {label}
+          </button>
+        ))}
+      </div>
+      <FeedingSlider label="Semana" value={Math.min(week, stageWeeks)} min={1} max={stageWeeks} onChange={setWeek} />
+      <FeedingSlider label="Maceta" value={potLiters} min={1} max={100} unit=" L" onChange={setPotLiters} />
+      <FeedingSlider label="Plantas" value={plants} min={1} max={50} onChange={setPlants} />
+      <p>Agua por riego: <strong>{result.liters.toFixed(1)} L</strong></p>
+      {/* Sin la tabla del fabricante (source) las dosis son de ejemplo */}
+      {table.source ? (
+        <p style={{ fontSize: "0.9em" }}>
+          Dosis segun la <a href={table.source} target="_blank" rel="noopener noreferrer">tabla del fabricante</a>.
+        </p>
+      ) : (
+        <p role="note" style={{ padding: "0.5em", border: "1px solid #C9A227", borderRadius: "0.5em" }}>
+          Dosis de ejemplo: todavia no son las de la tabla del fabricante. Segui las indicaciones del envase.
+        </p>
+      )}
+      <table style={{ width: "100%", borderCollapse: "collapse" }}>
+        <thead>
+          <tr>
+            <th style={{ textAlign: "left" }}>Producto</th>
+            <th style={{ textAlign: "right" }}>ml/L</th>
+            <th style={{ textAlign: "right" }}>ml por riego</th>
+          </tr>
+        </thead>
+        <tbody>
+          {result.products.map((product) => (
+            <tr key={product.name} style={{ opacity: product.mlPerLiter ? 1 : 0.5 }}>
+              <td>{product.name}</td>
+              <td style={{ textAlign: "right" }}>{product.mlPerLiter}</td>
+              <td style={{ textAlign: "right" }}>{product.ml.toFixed(1)}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+}
@@ -0,0 +1,19 @@
+import reflex as rx
+from pathlib import Path
+
+#El componente de React esta en feeding_calculator.js y se agrega al codigo de la pagina
+FEEDING_CALCULATOR_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class FeedingCalculator(rx.Component):
+    tag = "FeedingCalculator"
+
+    #Url de la tabla generada por growstreet_web/feeding/dosage.py
+    table_url: rx.Var[str]
+
+    def add_imports(self):
+        return {"react": ["useState", "useEffect", "useMemo"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [FEEDING_CALCULATOR_JS]
+
+feeding_calculator = FeedingCalculator.create
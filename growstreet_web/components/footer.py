@@ -1,18 +1,28 @@
 import reflex as rx
-import datetime
 import growstreet_web.styles.styles as styles
+from growstreet_web.components.optimized_image import optimized_image
 from growstreet_web.views.links.links_icon import links_icon
 
+#El año se calcula en el navegador, asi no hay que recompilar cada año.
+#El HTML pre-renderizado trae el año del build: en año nuevo puede no coincidir
+#con el del navegador, suppressHydrationWarning evita el aviso de hidratacion.
+#Las paginas del export estatico (sin JavaScript) muestran siempre el año del
+#build, hay que volver a exportarlas al cambiar el año
+current_year = rx.Var.create("new Date().getFullYear()", _var_is_local=False, _var_is_string=False)
+
+def year_text() -> rx.Component:
+    return rx.el.span(current_year, custom_attrs={"suppressHydrationWarning": rx.Var.create(True)})
+
 def footer() -> rx.Component:
     return rx.vstack(
-        rx.image(src="hoja_grow_street.png",
-                 height = "100px"),
-        rx.text(f"2023 - {datetime.date.today().year} Todos los derechos reservados"),
+        optimized_image(src="hoja_grow_street.png",
+                 height = "100px",
+                 lazy = True,
+                 alt = "Grow Street"),
+        rx.text("2023 - ", year_text(), " Todos los derechos reservados"),
         links_icon(),
         align = "center",
-        margin_top = '20px',
-        padding = styles.Size.SMALL.value,
-        style = styles.style_footer
+        class_name = styles.style_footer
 
         
         
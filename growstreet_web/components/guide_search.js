@@ -0,0 +1,101 @@
+// Buscador de las guias: todo corre en el navegador con el indice generado
+// por growstreet_web/guides/search_index.py (mismo stemmer y stopwords).
+
+const normalizeGuideText = (text) =>
+  text.normalize("NFD").replace(/[\u0300-\u036f]/g, "").toLowerCase();
+
+function stemGuideWord(word, stemmer) {
+  for (const suffix of stemmer.suffixes) {
+    if (word.endsWith(suffix) && word.length - suffix.length >= stemmer.min_length) {
+      return word.slice(0, word.length - suffix.length);
+    }
+  }
+  return word;
+}
+
+function guideQueryTerms(query, stemmer) {
+  const stopwords = new Set(stemmer.stopwords);
+  return (normalizeGuideText(query).match(/[a-z0-9]+/g) || [])
+    .filter((word) => !stopwords.has(word))
+    .map((word) => stemGuideWord(word, stemmer));
+}
+
+function searchGuides(index, query, limit) {
+  const terms = guideQueryTerms(query, index.stemmer);
+  if (terms.length === 0) {
+    return [];
+  }
+  const keys = index.termKeys || (index.termKeys = Object.keys(index.terms));
+  const scores = new Map();
+  terms.forEach((term, position) => {
+    // La ultima palabra se busca como prefijo mientras se escribe
+    const matches = position === terms.length - 1
+      ? keys.filter((key) => key.startsWith(term))
+      : (term in index.terms ? [term] : []);
+    for (const key of matches) {
+      const postings = index.terms[key];
+      const idf = Math.log(1 + index.sections.length / (postings.length / 2));
+      for (let i = 0; i < postings.length; i += 2) {
+        scores.set(postings[i], (scores.get(postings[i]) || 0) + postings[i + 1] * idf);
+      }
+    }
+  });
+  return [...scores.entries()]
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, limit)
+    .map(([section]) => {
+      const [doc, anchor, title] = index.sections[section];
+      const [route, guideTitle] = index.docs[doc];
+      return {
+        href: anchor ? `${route}#${anchor}` : route,
+        title: title || guideTitle,
+        guide: guideTitle,
+      };
+    });
+}
+
+function GuideSearch({ indexUrl, placeholder, limit = 8 }) {
+  const [index, setIndex] = useState(null);
+  const [query, setQuery] = useState("");
+  const loading = useRef(false);
+
+  // El indice se descarga recien cuando el usuario va a buscar
+  const loadIndex = () => {
+    if (loading.current) {
+      return;
+    }
+    loading.current = true;
+    fetch(indexUrl)
+      .then((response) => response.json())
+      .then(setIndex)
+      .catch(() => { loading.current = false; });
+  };
+
+  const results = useMemo(
+    () => (index && query ? searchGuides(index, query, limit) : []),
+    [index, query, limit],
+  );
+
+  return (
+    <div style={{ width: "100%", maxWidth: "600px" }}>
+      <input
+        type="search"
+        value={query}
+        placeholder={placeholder}
+        aria-label={placeholder}
+        onFocus={loadIndex}
+        onChange={(event) => { loadIndex(); setQuery(event.target.value); }}
+        style={{ width: "100%", padding: "0.5em", borderRadius: "0.5em", border: "1px solid var(--gray-7)" }}
+      />
+      {query && index && results.length === 0 && <p>No encontramos resultados</p>}
+      <ul style={{ listStyle: "none", padding: 0 }}>
+        {results.map((result) => (
+          <li key={result.href} style={{ padding: "0.25em 0" }}>
+            <a href={result.href}>{result.title}</a>
+            {result.title !== result.guide && <small> · {result.guide}</small>}
+          </li>
+        ))}
+      </ul>
+    </div>
+  );
+}
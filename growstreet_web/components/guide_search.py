@@ -0,0 +1,21 @@
+import reflex as rx
+from pathlib import Path
+
+#El componente de React esta en guide_search.js y se agrega al codigo de la pagina
+GUIDE_SEARCH_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class GuideSearch(rx.Component):
+    tag = "GuideSearch"
+
+    #Url del indice generado por growstreet_web/guides/search_index.py
+    index_url: rx.Var[str]
+
+    placeholder: rx.Var[str]
+
+    def add_imports(self):
+        return {"react": ["useState", "useRef", "useMemo"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [GUIDE_SEARCH_JS]
+
+guide_search = GuideSearch.create
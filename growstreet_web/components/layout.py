@@ -0,0 +1,49 @@
+import functools
+
+import reflex as rx
+from reflex.components.component import evaluate_style_namespaces
+import growstreet_web.styles.styles as styles
+from growstreet_web.components.navbar import navbar
+from growstreet_web.components.footer import footer
+from growstreet_web.components.lazy_section import lazy_section
+from growstreet_web.views.links.links import links
+
+#Partes del layout que se repiten en algunas paginas.
+#rx.memo las compila una sola vez en .web/utils/components.js y cada pagina
+#solo las referencia (<Links/>), asi el navegador las descarga y cachea una vez
+shared_links = rx.memo(links)
+
+
+@functools.cache
+def _shell_wrappers() -> dict[tuple[int, str], rx.Component]:
+    navbar_shell = rx.fragment(navbar())
+    #El footer va despues del contenido de la pagina ({children} de AppWrap, prioridad 0)
+    footer_shell = rx.fragment(
+        lazy_section(
+            rx.vstack(
+                footer(),
+            ),
+            placeholder_height = "250px",
+        ),
+    )
+    #_app.js no recibe el estilo de la app (app.style), se aplica aca
+    for shell in (navbar_shell, footer_shell):
+        shell._add_style_recursive(evaluate_style_namespaces(styles.BASE_STYLE))
+    return {
+        #Dentro del tema de radix (prioridad 20)
+        (10, "ShellNavbar"): navbar_shell,
+        (-1, "ShellFooter"): footer_shell,
+    }
+
+
+#Navbar y footer de todas las paginas: en lugar de ir en cada pagina se agregan
+#a _app.js, que envuelve a todas. Al navegar con los links de la navbar solo
+#cambia el contenido de la pagina, la navbar y el footer quedan montados
+class AppShell(rx.Fragment):
+
+    @staticmethod
+    def _get_app_wrap_components() -> dict[tuple[int, str], rx.Component]:
+        #Reflex agrega otros componentes al dict que recibe
+        return dict(_shell_wrappers())
+
+app_shell = AppShell.create
@@ -0,0 +1,43 @@
+// Seccion diferida: sus hijos se montan recien cuando la seccion se acerca a
+// la pantalla. Hasta entonces ocupa placeholderHeight para que no se mueva el
+// resto de la pagina. El HTML pre-renderizado lleva los hijos dentro de un
+// <noscript>, que el export estatico desenvuelve para las paginas sin JavaScript.
+
+function LazySection({ placeholderHeight = "0px", rootMargin = "200px", children }) {
+  const ref = useRef(null);
+  const [visible, setVisible] = useState(false);
+
+  useEffect(() => {
+    if (visible) {
+      return;
+    }
+    if (typeof IntersectionObserver === "undefined") {
+      setVisible(true);
+      return;
+    }
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        setVisible(true);
+        observer.disconnect();
+      }
+    }, { rootMargin });
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [visible, rootMargin]);
+
+  return (
+    <div
+      ref={ref}
+      data-lazy-section=""
+      style={{
+        width: "100%",
+        minHeight: visible ? undefined : placeholderHeight,
+        // Fuera de pantalla el navegador tampoco calcula el layout ni pinta la seccion
+        contentVisibility: "auto",
+        containIntrinsicSize: `auto ${placeholderHeight}`,
+      }}
+    >
+      {visible ? children : <noscript>{children}</noscript>}
+    </div>
+  );
+}
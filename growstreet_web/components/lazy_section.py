@@ -0,0 +1,26 @@
+import reflex as rx
+from pathlib import Path
+from typing import ClassVar
+
+#El componente de React esta en lazy_section.js y se agrega al codigo de la pagina
+LAZY_SECTION_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class LazySection(rx.Component):
+    tag = "LazySection"
+
+    #Alto aproximado del contenido, se reserva antes de montarlo
+    placeholder_height: rx.Var[str]
+
+    #Distancia a la pantalla a la que se empieza a montar (margen de IntersectionObserver)
+    root_margin: rx.Var[str]
+
+    #El contenido queda en el HTML (<noscript>), la pagina puede exportarse sin JavaScript
+    static_fallback: ClassVar[bool] = True
+
+    def add_imports(self):
+        return {"react": ["useState", "useRef", "useEffect"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [LAZY_SECTION_JS]
+
+lazy_section = LazySection.create
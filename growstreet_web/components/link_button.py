@@ -6,18 +6,17 @@ def link_button(title: str, body: str, socialm: str, url: str) -> rx.Component:
                 rx.button(
                     rx.hstack(
                         rx.icon(tag = socialm,
-                                width = styles.Size.BIG.value,
-                                height =  styles.Size.BIG.value,
+                                class_name = styles.style_icon,
                         ),      
                     rx.vstack(
-                        rx.text(title, style = styles.style_button_title),
-                        rx.text(body, style = styles.style_button_subtitle),
+                        rx.text(title, class_name = styles.style_button_title),
+                        rx.text(body, class_name = styles.style_button_subtitle),
 
                     
                     ),
                     ),
                     color_scheme = "teal",
-                    style = styles.style_button_links,
+                    class_name = styles.style_button_links,
                     
                    
                 ),
@@ -5,11 +5,10 @@ def link_icon(socialm: str, url: str) -> rx.Component:
     return rx.link(
             rx.hstack(
                 rx.icon(tag = socialm,
-                    width = styles.Size.BIG.value,
-                    height =  styles.Size.BIG.value),      
+                    class_name = styles.style_icon),      
             ),
             # color_scheme = "black",
-            style = styles.style_button_links,
+            class_name = styles.style_button_links,
                 
            href = url,
            width = "100%",
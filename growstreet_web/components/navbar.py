@@ -1,13 +1,29 @@
 import reflex as rx
 import growstreet_web.styles.styles as styles
+from growstreet_web.build.routes import ROUTES_URL
+from growstreet_web.components.optimized_image import optimized_image
+from growstreet_web.components.prefetch_link import prefetch_link
+
+#Links de las secciones: navegan sin recargar la pagina y precargan la pagina de destino
+def nav_link(text: str, href: str) -> rx.Component:
+    return prefetch_link(
+                rx.text(
+                    text,
+                    color = "white",
+                ),
+                href = href,
+                manifest_url = ROUTES_URL,
+                class_name = styles.style_nav_link,
+            )
 
 def navbar() -> rx.Component:
     return rx.hstack(
                 rx.hstack(
                     rx.box(
-                    rx.image(
+                    optimized_image(
                         src = "hoja_grow_street.png",
-                        height = styles.Size.BIG.value
+                        height = styles.Size.BIG.value,
+                        alt = "Grow Street",
                     ),
 
                         background_color="white",
@@ -15,36 +31,26 @@ def navbar() -> rx.Component:
                         margin="4px",
                         padding="4px",
                     ),
-                    rx.text.strong(
-                        "Grow Street",
-                        color = "white",
-                                               
+                    prefetch_link(
+                        rx.text.strong(
+                            "Grow Street",
+                            color = "white",
+                        ),
+                        href = "/",
+                        manifest_url = ROUTES_URL,
+                        class_name = styles.style_nav_link,
                     ),
                     align_items = "center",
                     width = "50%"           
                 ),
                 rx.hstack(
-                    rx.text(
-                        "Tienda",
-                        color = "white",
-                    ),
-                    rx.text(
-                        "Guia de cultivo",
-                        color = "white",
-                    ),
-                    rx.text(
-                        "Sobre nosotros",
-                        color = "white",
-                    ),
+                    nav_link("Tienda", "/tienda"),
+                    nav_link("Guia de cultivo", "/guias"),
+                    nav_link("Sobre nosotros", "/nosotros"),
                     width = "50%",
                     justify = "end",
                     
                 ),
             align_items = "center",
-            position = "sticky",
-            bg=styles.Colors.AZUL,
-            padding_x = styles.Size.DEFAULT.value,
-            padding_y = styles.Size.SMALL.value,
-            z_index = "999",
-            top = "0"
+            class_name = styles.style_navbar,
            )
\ No newline at end of file
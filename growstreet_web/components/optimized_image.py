@@ -0,0 +1,87 @@
+import reflex as rx
+from functools import lru_cache
+from growstreet_web.build.images import FORMATS, MIME_TYPES, load_manifest
+
+#Tamaño de fuente base del navegador, para pasar em/rem a px
+ROOT_FONT_SIZE_PX = 16
+
+#Densidad de pantalla maxima que cubre la imagen por defecto (src)
+MAX_DENSITY = 2
+
+
+@lru_cache(maxsize=1)
+def _manifest() -> dict:
+    #Se lee una sola vez al compilar las paginas
+    return load_manifest()
+
+
+def _length_to_px(length: str) -> float:
+    value = length.strip()
+    for unit, factor in (("rem", ROOT_FONT_SIZE_PX), ("em", ROOT_FONT_SIZE_PX), ("px", 1)):
+        if value.endswith(unit):
+            return float(value[:-len(unit)]) * factor
+    return float(value)
+
+
+def _src_set(variants: list) -> str:
+    return ", ".join(f"{url} {width}w" for width, url in variants)
+
+
+def _default_src(variants: list, display_width: int) -> str:
+    #La variante mas chica que alcance para pantallas de alta densidad
+    for width, url in variants:
+        if width >= display_width * MAX_DENSITY:
+            return url
+    return variants[-1][1]
+
+
+#lazy: para imagenes debajo del primer scroll, el navegador las descarga al acercarse
+def optimized_image(src: str, height: str, alt: str = "", lazy: bool = False, **props) -> rx.Component:
+    entry = _manifest().get(src.lstrip("/"))
+    if lazy:
+        props["loading"] = "lazy"
+
+    #Si todavia no se corrio el build de imagenes se usa el archivo original
+    if entry is None:
+        return rx.image(src = src, height = height, alt = alt, **props)
+
+    #Placeholder borroso (solo imagenes sin transparencia) hasta que carga la imagen
+    if entry.get("placeholder"):
+        props.setdefault("background_image", f"url({entry['placeholder']})")
+        props.setdefault("background_size", "cover")
+        props.setdefault("background_repeat", "no-repeat")
+
+    display_height = _length_to_px(height)
+    display_width = round(display_height * entry["width"] / entry["height"])
+    sizes = f"{display_width}px"
+    variants = entry["variants"]
+
+    sources = [
+        rx.el.source(
+            type = MIME_TYPES[fmt],
+            src_set = _src_set(variants[fmt]),
+            sizes = sizes,
+        )
+        for fmt in FORMATS
+        if fmt in variants
+    ]
+    fallback = variants[entry["fallback"]]
+
+    return rx.el.picture(
+        *sources,
+        rx.el.img(
+            src = _default_src(fallback, display_width),
+            src_set = _src_set(fallback),
+            sizes = sizes,
+            alt = alt,
+            decoding = "async",
+            #Ancho y alto reales para que el navegador reserve el espacio
+            custom_attrs = {
+                "width": str(display_width),
+                "height": str(round(display_height)),
+            },
+            height = height,
+            width = "auto",
+            **props,
+        ),
+    )
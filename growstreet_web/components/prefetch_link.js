@@ -0,0 +1,72 @@
+// Link interno con precarga: navega del lado del cliente (next/link, sin
+// recargar la pagina ni volver a hidratar el estado) y precarga la pagina de
+// destino cuando el link entra en pantalla o cuando el mouse pasa por encima.
+// El codigo de la pagina se pide con router.prefetch y los datos que descarga
+// al montarse (ej: el indice de las guias) salen del manifest de rutas.
+
+const prefetchedRoutes = new Set();
+let routeManifest = null;
+
+function loadRouteManifest(manifestUrl) {
+  if (!routeManifest) {
+    routeManifest = fetch(manifestUrl)
+      .then((response) => (response.ok ? response.json() : {}))
+      .catch(() => ({}));
+  }
+  return routeManifest;
+}
+
+function prefetchRoute(router, href, manifestUrl) {
+  if (prefetchedRoutes.has(href)) {
+    return;
+  }
+  prefetchedRoutes.add(href);
+  router.prefetch(href).catch(() => {});
+  loadRouteManifest(manifestUrl).then((manifest) => {
+    // El manifest usa las rutas sin la barra final
+    const route = manifest[href.replace(/\/$/, "") || "/"];
+    for (const url of route?.prefetch ?? []) {
+      const link = document.createElement("link");
+      link.rel = "prefetch";
+      link.href = url;
+      document.head.appendChild(link);
+    }
+  });
+}
+
+function PrefetchLink({ href, manifestUrl, children, ...props }) {
+  const router = useRouter();
+  const ref = useRef(null);
+
+  useEffect(() => {
+    // Con ahorro de datos solo se precarga al pasar el mouse
+    if (navigator.connection?.saveData || typeof IntersectionObserver === "undefined") {
+      return;
+    }
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        prefetchRoute(router, href, manifestUrl);
+        observer.disconnect();
+      }
+    });
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [href, manifestUrl]);
+
+  const prefetch = () => prefetchRoute(router, href, manifestUrl);
+
+  // prefetch={false}: la precarga la maneja este componente (una sola vez por ruta)
+  return (
+    <NextLink
+      href={href}
+      prefetch={false}
+      ref={ref}
+      onMouseEnter={prefetch}
+      onFocus={prefetch}
+      onTouchStart={prefetch}
+      {...props}
+    >
+      {children}
+    </NextLink>
+  );
+}
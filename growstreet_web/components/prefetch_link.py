@@ -0,0 +1,31 @@
+import reflex as rx
+from pathlib import Path
+from typing import ClassVar
+from reflex.utils.imports import ImportVar
+
+#El componente de React esta en prefetch_link.js y se agrega al codigo de la pagina
+PREFETCH_LINK_JS = Path(__file__).with_suffix(".js").read_text(encoding="utf-8")
+
+class PrefetchLink(rx.Component):
+    tag = "PrefetchLink"
+
+    #Ruta interna de destino
+    href: rx.Var[str]
+
+    #Manifest de rutas que genera el build (build/routes.py)
+    manifest_url: rx.Var[str]
+
+    #Sin JavaScript queda un <a href> comun
+    static_fallback: ClassVar[bool] = True
+
+    def add_imports(self):
+        return {
+            "react": ["useRef", "useEffect"],
+            "next/router": ["useRouter"],
+            "next/link": [ImportVar(tag = "NextLink", is_default = True)],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        return [PREFETCH_LINK_JS]
+
+prefetch_link = PrefetchLink.create
@@ -1,114 +1,57 @@
 import reflex as rx
 import growstreet_web.styles.styles as styles
-
-def products_card() -> rx.Component:
-    return rx.hstack(
-                rx.flex(
-                    rx.card(
-                        rx.link(
-                            rx.flex(
-                                rx.image(src="/products/top_deeper_250_embase.png",
-                                            height = "120px"),
-                                rx.box(
-                                    rx.heading("Top DEEPER"),
-                                    rx.text("Top Candy es un potenciador de floración formulado para aumentar el contenido de"),
-                                    rx.text("azúcares y resinas en las flores de cannabis. Mejora el sabor y el aroma final del producto,"),
-                                    rx.text("proporcionando cogollos más densos y resinosos"),
-                                ),
-                                spacing="2",
-                                direction = "column",
-                                align = "center"
-                                
-                            ),
-                            # href="PAGINA DEL PRODUCTO"
+from growstreet_web.catalog.queries import featured_products
+from growstreet_web.components.optimized_image import optimized_image
+
+def product_image(src) -> rx.Component:
+    #Con una ruta fija se usan las versiones optimizadas,
+    #si viene del estado (Var) se usa la imagen original
+    if isinstance(src, str):
+        return optimized_image(src = src, height = "120px", lazy = True)
+    return rx.image(src = src, height = "120px", loading = "lazy")
+
+#Sirve tanto para un Product como para un item de rx.foreach
+#actions se agrega abajo de la card (ej: el selector del carrito en la tienda)
+def product_card(product, *actions) -> rx.Component:
+    return rx.card(
+                rx.link(
+                    rx.flex(
+                        product_image(product.image),
+                        rx.box(
+                            rx.heading(product.name),
+                            rx.text(product.description),
+                            rx.text.strong("$ ", product.price),
                         ),
-                        as_child=True,
-                        #Tamaño total de la card
-                        width = "300px"
-
+                        *actions,
+                        spacing="2",
+                        direction = "column",
+                        align = "center"
                     ),
+                    # href="PAGINA DEL PRODUCTO"
+                ),
+                as_child=True,
+                #Tamaño total de la card
+                class_name = styles.style_product_card
+            )
+
+def products_grid(*cards) -> rx.Component:
+    return rx.flex(
+                *cards,
+                #Propiedades dentro del flex
+                spacing = styles.Size.BIG.value,
+                justify = "center",
+                width = "100%",
+                wrap = "wrap"
+            )
 
-                    rx.card(
-                        #La idea de este link es que dirija directo a la venta
-                        rx.link(
-                            #Dentro de este link pruebo con vstack
-                            rx.vstack(    
-                                rx.image(src="/products/top_veg_250_embase.png",
-                                            height = "120px"),
-                                    rx.box(
-                                        rx.heading("Top VEG"),
-                                        rx.text("Top Candy es un potenciador de floración formulado para aumentar el contenido de"),
-                                        rx.text("azúcares y resinas en las flores de cannabis. Mejora el sabor y el aroma final del producto,"),
-                                        rx.text("proporcionando cogollos más densos y resinosos"),
-                                    ),
-                                    spacing="2",
-                                    align = "center"
-                            ),
-                            # href="PAGINA DEL PRODUCTO"
-                        ),
-                            as_child=True,
-                            #Tamaño total de la card
-                            width = "300px",
-
-                        ),
-
-                        rx.card(
-                                rx.link(
-                                    rx.flex(
-                                        rx.image(src="/products/top_bloom_250_embase.png",
-                                                 height = "120px"),
-                                        rx.box(
-                                            rx.heading("Top BLOOM"),
-                                            rx.text("Top Candy es un potenciador de floración formulado para aumentar el contenido de"),
-                                            rx.text("azúcares y resinas en las flores de cannabis. Mejora el sabor y el aroma final del producto,"),
-                                            rx.text("proporcionando cogollos más densos y resinosos"),
-                                        ),
-                                        spacing="2",
-                                        direction = "column",
-                                        align = "center"
-                                    ),
-                                    # href="PAGINA DEL PRODUCTO"
-                                ),
-                                as_child=True,
-                                #Tamaño total de la card
-                                width = "300px"
-
-                            ),
-
-                            rx.card(
-                                rx.link(
-                                    rx.flex(
-                                        rx.image(src="/products/top_candy_250_embase.png",
-                                                 height = "120px"),
-                                        rx.box(
-                                            rx.heading("Top CANDY"),
-                                            rx.text("Top Candy es un potenciador de floración formulado para aumentar el contenido de"),
-                                            rx.text("azúcares y resinas en las flores de cannabis. Mejora el sabor y el aroma final del producto,"),
-                                            rx.text("proporcionando cogollos más densos y resinosos"),
-                                            
-                                        ),
-                                        spacing="2",
-                                        direction = "column",
-                                        align = "center"
-                                    ),
-                                    # href="PAGINA DEL PRODUCTO"
-                                ),
-                                as_child=True,
-                                #Tamaño total de la card
-                                width = "300px"
-
-                            ),
-
-                    #Propiedades dentro del flex
-                    spacing = styles.Size.BIG.value,
-                    justify = "center",
-                    width = "100%",
-                    wrap = "wrap"
-                    
+#Productos destacados de la pagina principal, se leen del catalogo al compilar
+def products_card() -> rx.Component:
+    return rx.hstack(
+                products_grid(
+                    *[product_card(product) for product in featured_products()]
                 ),
-                
                 #Props de hstack
                 width = "100%",
-                margin_y = styles.Size.BIG.value,
+                class_name = styles.style_section,
 
-    )
\ No newline at end of file
+    )
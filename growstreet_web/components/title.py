@@ -9,7 +9,7 @@ def title(text: str) -> rx.Component:
             # para poder modificar 
             # align = "center",
             # size = "3",
-            style = styles.style_title
+            class_name = styles.style_title
 
 
 
@@ -0,0 +1,30 @@
+#Endpoint de las publicaciones: GET /api/feed/{canal} responde siempre desde el
+#cache (feed/cache.py), nunca espera a YouTube o Instagram salvo la primera vez.
+import reflex as rx
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from growstreet_web.feed.cache import TTL_SECONDS, feed_cache
+from growstreet_web.feed.providers import CHANNELS
+
+ROUTE = "/api/feed/{channel}"
+
+#El navegador y los proxies tambien pueden usar una copia vencida mientras revalidan
+CACHE_CONTROL = f"public, max-age=60, stale-while-revalidate={TTL_SECONDS}"
+
+
+def feed_url(channel: str) -> str:
+    from reflex.config import get_config
+
+    return get_config().api_url.rstrip("/") + ROUTE.format(channel = channel)
+
+
+async def get_feed(channel: str):
+    if channel not in CHANNELS:
+        raise HTTPException(status_code=404, detail="Canal desconocido")
+    return JSONResponse(await feed_cache.get(channel), headers={"cache-control": CACHE_CONTROL})
+
+
+def register(app: rx.App):
+    app.api.add_api_route(ROUTE, get_feed, methods=["GET"])
+    app.register_lifespan_task(feed_cache.run)
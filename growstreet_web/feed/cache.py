@@ -0,0 +1,166 @@
+#Cache de las publicaciones de cada canal con stale-while-revalidate:
+#   - Siempre se responde con lo que hay en cache, aunque este vencido.
+#   - Si vencio (TTL) se actualiza en segundo plano, una sola vez por canal
+#     aunque lleguen muchos requests a la vez (single flight).
+#   - Si todavia no hay nada (primer request) se espera esa misma actualizacion.
+#Se guarda tambien en disco para que al reiniciar no haya que esperar a las APIs.
+#Con varios workers la copia en disco es compartida: un lock de archivo por canal
+#hace que uno solo pida a la API, los demas leen lo que guardo.
+import asyncio
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+
+from reflex.utils import console
+
+from growstreet_web.feed.providers import CHANNELS, FeedItem, provider_for
+
+try:
+    import fcntl
+except ImportError:
+    #Windows: sin lock entre procesos (ahi reflex corre un solo worker)
+    fcntl = None
+
+#Cada cuanto se vuelven a pedir las publicaciones (segundos)
+TTL_SECONDS = 15 * 60
+
+#Espera maxima del primer request de un canal sin cache
+COLD_TIMEOUT_SECONDS = 5
+
+#Cada cuanto se reintenta tomar el lock de un canal que esta actualizando otro worker
+LOCK_POLL_SECONDS = 0.1
+
+CACHE_DIR = Path(os.environ.get("GROWSTREET_FEED_CACHE_DIR", ".feed_cache"))
+
+
+def _source(channel: str) -> str:
+    provider = provider_for(channel)
+    return provider.source if provider is not None else ""
+
+
+class FeedCache:
+
+    def __init__(self, ttl: float = TTL_SECONDS, directory: Path = CACHE_DIR):
+        self.ttl = ttl
+        self.directory = directory
+        #{canal: (publicaciones, momento de la actualizacion)}
+        self.entries: dict[str, tuple[list[dict], float]] = {}
+        #Actualizacion en curso de cada canal
+        self.refreshing: dict[str, asyncio.Task] = {}
+
+    def _path(self, channel: str) -> Path:
+        return self.directory / f"{channel}.json"
+
+    def _expired(self, entry: tuple[list[dict], float]) -> bool:
+        return time.time() - entry[1] > self.ttl
+
+    def _load(self, channel: str) -> tuple[list[dict], float] | None:
+        path = self._path(channel)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        #Una copia de otra fuente (ej: los fixtures de desarrollo) no se muestra
+        if data.get("source", "") != _source(channel):
+            return None
+        return data["items"], data["fetched_at"]
+
+    def _save(self, channel: str, items: list[dict], fetched_at: float):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        #Temporal + reemplazo para que otro worker no lea un archivo a medias
+        tmp = self._path(channel).with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(dict(items = items, fetched_at = fetched_at, source = _source(channel))))
+        os.replace(tmp, self._path(channel))
+
+    @contextlib.asynccontextmanager
+    async def _lock(self, channel: str):
+        if fcntl is None:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        #flock se libera solo si el worker muere con el lock tomado
+        with open(self.directory / f"{channel}.lock", "w") as lock_file:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_SECONDS)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    async def _fetch(self, channel: str):
+        async with self._lock(channel):
+            #Mientras se esperaba el lock otro worker pudo haberlo actualizado
+            entry = self._load(channel)
+            if entry is not None and not self._expired(entry):
+                self.entries[channel] = entry
+                return
+            provider = provider_for(channel)
+            try:
+                items: list[FeedItem] = await provider.fetch() if provider is not None else []
+            except Exception as error:
+                #Si falla la API se sigue mostrando lo ultimo que se obtuvo
+                console.warn(f"feed: no se pudo actualizar {channel}: {error!r}")
+                return
+            fetched_at = time.time()
+            self.entries[channel] = ([item.dict() for item in items], fetched_at)
+            self._save(channel, *self.entries[channel])
+
+    def refresh(self, channel: str) -> asyncio.Task:
+        #Single flight: si ya hay una actualizacion en curso se reutiliza
+        task = self.refreshing.get(channel)
+        if task is None or task.done():
+            task = asyncio.create_task(self._fetch(channel))
+            self.refreshing[channel] = task
+        return task
+
+    async def get(self, channel: str) -> dict:
+        if channel not in CHANNELS:
+            raise KeyError(channel)
+
+        entry = self.entries.get(channel)
+        #Otro worker (o el proceso anterior) puede haberlo actualizado en disco
+        if entry is None or self._expired(entry):
+            entry = max(
+                (e for e in (entry, self._load(channel)) if e is not None),
+                key = lambda e: e[1],
+                default = None,
+            )
+            if entry is not None:
+                self.entries[channel] = entry
+
+        if entry is None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self.refresh(channel)), COLD_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            entry = self.entries.get(channel, ([], 0.0))
+        elif self._expired(entry):
+            self.refresh(channel)
+
+        items, fetched_at = entry
+        return dict(
+            items = items,
+            fetched_at = fetched_at,
+            stale = time.time() - fetched_at > self.ttl,
+        )
+
+    async def run(self):
+        #Actualizacion periodica mientras corre el backend, asi los requests casi nunca ven datos vencidos.
+        #Cada worker corre este loop, pero refresh solo pide a la API si la copia en disco tambien vencio
+        while True:
+            for channel in CHANNELS:
+                entry = self.entries.get(channel) or self._load(channel)
+                if entry is None or self._expired(entry):
+                    await self.refresh(channel)
+                elif channel not in self.entries:
+                    self.entries[channel] = entry
+            await asyncio.sleep(self.ttl / 2)
+
+
+feed_cache = FeedCache()
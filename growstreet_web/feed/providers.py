@@ -0,0 +1,128 @@
+#Fuentes de las publicaciones de cada red. Cada provider devuelve las ultimas
+#publicaciones como FeedItem; el cache (feed/cache.py) decide cuando llamarlos.
+import json
+import os
+import xml.etree.ElementTree as ElementTree
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+FIXTURES_DIR = Path(__file__).with_name("fixtures")
+
+#Canales que se muestran y su pagina (el link si no hay publicaciones)
+CHANNELS = {
+    "youtube": "https://www.youtube.com/@GrowStreetCultivo",
+    "instagram": "https://www.instagram.com/grow.street.cultivo",
+}
+
+#Cantidad de publicaciones que se guardan por canal
+MAX_ITEMS = 6
+
+#Tiempo maximo de espera a la API de cada red (segundos)
+TIMEOUT = 10
+
+#GROWSTREET_FEED_PROVIDER=fixture usa los fixtures (ej: en desarrollo sin internet)
+PROVIDER_ENV = "GROWSTREET_FEED_PROVIDER"
+YOUTUBE_CHANNEL_ENV = "GROWSTREET_YOUTUBE_CHANNEL_ID"
+INSTAGRAM_TOKEN_ENV = "INSTAGRAM_ACCESS_TOKEN"
+
+YOUTUBE_FEED_URL = "https://www.youtube.com/feeds/videos.xml"
+INSTAGRAM_MEDIA_URL = "https://graph.instagram.com/me/media"
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+_YOUTUBE = "{http://www.youtube.com/xml/schemas/2015}"
+
+
+@dataclass(frozen=True)
+class FeedItem:
+    title: str
+    url: str
+    thumbnail: str = ""
+    #Fecha ISO 8601
+    published: str = ""
+
+    def dict(self) -> dict:
+        return asdict(self)
+
+
+class FixtureProvider:
+
+    #Se guarda con la copia en disco del cache, para no mezclar datos de distintas fuentes
+    source = "fixture"
+
+    def __init__(self, channel: str):
+        self.path = FIXTURES_DIR / f"{channel}.json"
+
+    async def fetch(self) -> list[FeedItem]:
+        return [FeedItem(**item) for item in json.loads(self.path.read_text())][:MAX_ITEMS]
+
+
+class YouTubeProvider:
+    #Feed RSS publico del canal, no necesita clave de API
+
+    source = "youtube"
+
+    def __init__(self, channel_id: str):
+        self.channel_id = channel_id
+
+    async def fetch(self) -> list[FeedItem]:
+        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+            response = await client.get(YOUTUBE_FEED_URL, params={"channel_id": self.channel_id})
+            response.raise_for_status()
+        return parse_youtube_feed(response.text)
+
+
+def parse_youtube_feed(xml: str) -> list[FeedItem]:
+    items = []
+    for entry in ElementTree.fromstring(xml).findall(f"{_ATOM}entry")[:MAX_ITEMS]:
+        video_id = entry.findtext(f"{_YOUTUBE}videoId", "")
+        thumbnail = entry.find(f"{_MEDIA}group/{_MEDIA}thumbnail")
+        items.append(FeedItem(
+            title = entry.findtext(f"{_ATOM}title", ""),
+            url = f"https://www.youtube.com/watch?v={video_id}",
+            thumbnail = thumbnail.get("url", "") if thumbnail is not None else "",
+            published = entry.findtext(f"{_ATOM}published", ""),
+        ))
+    return items
+
+
+class InstagramProvider:
+    #API de Instagram (Basic Display / Graph) con un token de larga duracion
+
+    source = "instagram"
+
+    def __init__(self, access_token: str):
+        self.access_token = access_token
+
+    async def fetch(self) -> list[FeedItem]:
+        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+            response = await client.get(INSTAGRAM_MEDIA_URL, params={
+                "fields": "caption,permalink,media_type,media_url,thumbnail_url,timestamp",
+                "limit": MAX_ITEMS,
+                "access_token": self.access_token,
+            })
+            response.raise_for_status()
+        return [
+            FeedItem(
+                #El titulo es la primera linea del texto de la publicacion
+                title = (media.get("caption") or "").split("\n")[0],
+                url = media["permalink"],
+                thumbnail = media.get("thumbnail_url") or media.get("media_url", ""),
+                published = media.get("timestamp", ""),
+            )
+            for media in response.json().get("data", [])[:MAX_ITEMS]
+        ]
+
+
+def provider_for(channel: str):
+    #Los fixtures solo se usan si se piden explicitamente, nunca como reemplazo de la API
+    if os.environ.get(PROVIDER_ENV) == "fixture":
+        return FixtureProvider(channel)
+    if channel == "youtube" and os.environ.get(YOUTUBE_CHANNEL_ENV):
+        return YouTubeProvider(os.environ[YOUTUBE_CHANNEL_ENV])
+    if channel == "instagram" and os.environ.get(INSTAGRAM_TOKEN_ENV):
+        return InstagramProvider(os.environ[INSTAGRAM_TOKEN_ENV])
+    #Sin credenciales no hay publicaciones, FeedList muestra solo el link al canal
+    return None
@@ -0,0 +1,86 @@
+#Tabla de dosis de la calculadora de riego. Se calcula toda junta al hacer el
+#build y se sirve como archivo estatico, la calculadora solo multiplica por
+#los litros en el navegador.
+#
+#Formato (compacto, listas en lugar de objetos):
+#   products:         [nombre, ...]
+#   stages:           [[etapa, nombre, semanas], ...]
+#   doses:            {etapa: [[ml/L de cada producto] por semana]}
+#   watering_fraction: litros de riego por litro de maceta
+#   source:           URL de la tabla del fabricante, null si las dosis son de ejemplo
+#
+#Uso: python -m growstreet_web.build dosis
+import json
+
+from growstreet_web.build.images import ASSETS_DIR
+from growstreet_web.catalog.queries import load_seed
+
+TABLE_PATH = ASSETS_DIR / "generated" / "dosis.json"
+TABLE_URL = "/generated/dosis.json"
+
+#En cada riego se usa cerca de un cuarto del volumen de la maceta
+WATERING_FRACTION = 0.25
+
+#PLACEHOLDER: STAGE_CURVES y PRODUCT_DOSES son valores de ejemplo para probar la
+#calculadora, NO salen de la tabla de riego del fabricante de los productos Top.
+#Al cargar la tabla oficial poner su URL aca; mientras sea None la calculadora
+#(components/feeding_calculator.js) avisa que las dosis son de ejemplo
+DOSES_SOURCE: str | None = None
+
+#Intensidad de la etapa por semana (1 = dosis completa)
+STAGE_CURVES = {
+    "deeper": ("Enraizamiento", (0.5, 1.0)),
+    "veg": ("Vegetativo", (0.5, 0.75, 1.0, 1.0)),
+    "bloom": ("Floracion", (0.75, 1.0, 1.0, 1.0, 1.0, 1.0, 0.75, 0.0)),
+}
+
+#Dosis completa (ml/L) de cada producto por etapa y semanas en las que se usa
+#(desde, hasta incluidas, empezando en 1). La ultima semana de floracion es de lavado
+PRODUCT_DOSES = {
+    "Top DEEPER": {"deeper": (2.0, 1, 2), "veg": (1.0, 1, 2), "bloom": (1.0, 1, 1)},
+    "Top VEG": {"veg": (4.0, 1, 4), "bloom": (2.0, 1, 2)},
+    "Top BLOOM": {"bloom": (4.0, 2, 7)},
+    "Top CANDY": {"bloom": (3.0, 4, 7)},
+}
+
+
+def dose_matrix(stage: str, products: list[str]) -> list[list[float]]:
+    #Curva de la etapa (semanas) x dosis de cada producto, con cero fuera de sus semanas
+    _, curve = STAGE_CURVES[stage]
+    columns = [PRODUCT_DOSES[product].get(stage, (0.0, 0, 0)) for product in products]
+    return [
+        [
+            round(intensity * dose, 2) if first <= week <= last else 0
+            for dose, first, last in columns
+        ]
+        for week, intensity in enumerate(curve, start=1)
+    ]
+
+
+def build_table() -> dict:
+    #Solo productos del catalogo, en el mismo orden
+    products = [product.name for product in load_seed() if product.name in PRODUCT_DOSES]
+    missing = PRODUCT_DOSES.keys() - set(products)
+    if missing:
+        raise ValueError(f"Productos sin cargar en el catalogo: {', '.join(sorted(missing))}")
+    return dict(
+        products = products,
+        stages = [[stage, label, len(curve)] for stage, (label, curve) in STAGE_CURVES.items()],
+        doses = {stage: dose_matrix(stage, products) for stage in STAGE_CURVES},
+        watering_fraction = WATERING_FRACTION,
+        source = DOSES_SOURCE,
+    )
+
+
+def main():
+    table = build_table()
+    TABLE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TABLE_PATH.write_text(json.dumps(table, ensure_ascii=False, separators=(",", ":")))
+    weeks = sum(len(doses) for doses in table["doses"].values())
+    print(f"dosis: {len(table['products'])} productos, {weeks} semanas")
+    if DOSES_SOURCE is None:
+        print("dosis: las dosis son de ejemplo (sin DOSES_SOURCE), la calculadora lo muestra")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#Endpoint para cargar lecturas y riegos desde los sensores o un script.
+#Solo se registra si esta definida la variable de entorno GROWLOG_TOKEN, y
+#cada request tiene que mandar el header "Authorization: Bearer <token>".
+#
+#   POST /api/growlog/readings  {"grow": ..., "plant": ..., "ph": 6.1, "ec": 1.4}
+#   POST /api/growlog/feedings  {"grow": ..., "plant": ..., "product": ..., "ml_per_liter": 2, "liters": 5}
+import os
+import secrets
+from typing import Optional
+
+import reflex as rx
+from fastapi import Header, HTTPException
+from pydantic import BaseModel
+
+from growstreet_web.growlog import queries
+
+TOKEN_ENV = "GROWLOG_TOKEN"
+
+
+class ReadingIn(BaseModel):
+    grow: str = queries.DEFAULT_GROW
+    plant: str
+    ts: Optional[int] = None
+    ph: Optional[float] = None
+    ec: Optional[float] = None
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+
+
+class FeedingIn(BaseModel):
+    grow: str = queries.DEFAULT_GROW
+    plant: str
+    ts: Optional[int] = None
+    product: str
+    ml_per_liter: float
+    liters: float
+
+
+def _check_token(authorization: str):
+    expected = f"Bearer {os.environ[TOKEN_ENV]}"
+    if not secrets.compare_digest(authorization, expected):
+        raise HTTPException(status_code=401, detail="Token invalido")
+
+
+async def add_reading(reading: ReadingIn, authorization: str = Header("")):
+    _check_token(authorization)
+    return dict(id = queries.append_reading(**reading.dict()).id)
+
+
+async def add_feeding(feeding: FeedingIn, authorization: str = Header("")):
+    _check_token(authorization)
+    return dict(id = queries.append_feeding(**feeding.dict()).id)
+
+
+def register(app: rx.App):
+    if not os.environ.get(TOKEN_ENV):
+        return
+    app.api.add_api_route("/api/growlog/readings", add_reading, methods=["POST"])
+    app.api.add_api_route("/api/growlog/feedings", add_feeding, methods=["POST"])
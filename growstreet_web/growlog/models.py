@@ -0,0 +1,37 @@
+from typing import Optional
+
+import reflex as rx
+import sqlalchemy
+
+
+#Registro del cultivo: tablas de solo agregado (no se editan ni se borran filas).
+#ts es el momento de la lectura en segundos desde epoch (UTC).
+class Reading(rx.Model, table=True):
+    grow: str
+    plant: str
+    ts: int
+    ph: Optional[float] = None
+    #Conductividad en mS/cm
+    ec: Optional[float] = None
+    #Temperatura en °C
+    temperature: Optional[float] = None
+    #Humedad relativa en %
+    humidity: Optional[float] = None
+
+    #Los graficos siempre filtran por cultivo y rango de tiempo
+    __table_args__ = (
+        sqlalchemy.Index("ix_reading_grow_ts", "grow", "ts"),
+    )
+
+
+class Feeding(rx.Model, table=True):
+    grow: str
+    plant: str
+    ts: int
+    product: str
+    ml_per_liter: float
+    liters: float
+
+    __table_args__ = (
+        sqlalchemy.Index("ix_feeding_grow_ts", "grow", "ts"),
+    )
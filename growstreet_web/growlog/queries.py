@@ -0,0 +1,167 @@
+import math
+import time
+from datetime import datetime, timezone
+
+import reflex as rx
+import sqlalchemy
+import sqlmodel
+
+from growstreet_web.growlog.models import Feeding, Reading
+
+#Cultivo que se muestra por defecto (views/header/header.py)
+DEFAULT_GROW = "mother-gorilla"
+
+METRICS = {
+    "ph": "pH",
+    "ec": "EC (mS/cm)",
+    "temperature": "Temperatura (°C)",
+    "humidity": "Humedad (%)",
+}
+
+#Cantidad maxima de puntos por grafico, sin importar el rango de tiempo
+MAX_POINTS = 200
+
+
+def _metric_column(metric: str):
+    if metric not in METRICS:
+        raise ValueError(f"Metrica desconocida: {metric}")
+    return getattr(Reading, metric)
+
+
+def bucket_width(start: int, end: int, points: int = MAX_POINTS) -> int:
+    return max(1, math.ceil((end - start) / points))
+
+
+def chart_window(range_days: int, now: int, points: int = MAX_POINTS) -> tuple[int, int, int]:
+    #Inicio, fin (sin incluir) y ancho de los puntos del grafico. downsample y
+    #merge_readings tienen que usar el mismo ancho, si no las lecturas nuevas no
+    #caen en los puntos que ya existen
+    end = now + 1
+    start = end - range_days * 24 * 3600
+    return start, end, bucket_width(start, end, points)
+
+
+def point_label(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%d/%m %H:%M")
+
+
+def make_point(ts: int, low: float, high: float, total: float, count: int) -> dict:
+    #count y total permiten sumar lecturas nuevas al ultimo punto sin volver a consultar
+    return dict(
+        ts = ts,
+        label = point_label(ts),
+        min = round(low, 2),
+        max = round(high, 2),
+        avg = round(total / count, 2),
+        total = total,
+        count = count,
+    )
+
+
+def downsample(
+    session: sqlmodel.Session,
+    grow: str,
+    metric: str,
+    start: int,
+    end: int,
+    points: int = MAX_POINTS,
+    max_id: int | None = None,
+    width: int | None = None,
+) -> list[dict]:
+    #Agrupa en la base por intervalos de igual duracion (min/max/promedio),
+    #asi la respuesta tiene como mucho `points` puntos aunque el rango sea de meses
+    column = _metric_column(metric)
+    width = width or bucket_width(start, end, points)
+    bucket = ((Reading.ts - start) // width).label("bucket")
+    query = (
+        sqlmodel.select(
+            bucket,
+            sqlalchemy.func.min(column),
+            sqlalchemy.func.max(column),
+            sqlalchemy.func.sum(column),
+            sqlalchemy.func.count(column),
+        )
+        .where(Reading.grow == grow, Reading.ts >= start, Reading.ts < end, column.is_not(None))
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    #Las lecturas con id mayor las agrega despues el seguimiento del grafico
+    if max_id is not None:
+        query = query.where(Reading.id <= max_id)
+    return [
+        make_point(start + index * width, low, high, total, count)
+        for index, low, high, total, count in session.exec(query).all()
+    ]
+
+
+def last_reading_id(session: sqlmodel.Session) -> int:
+    return session.exec(sqlmodel.select(sqlalchemy.func.max(Reading.id))).one() or 0
+
+
+def readings_after(session: sqlmodel.Session, grow: str, metric: str, after_id: int) -> list[tuple[int, int, float]]:
+    #Por id y no por ts: una lectura cargada tarde (con un ts anterior) tambien aparece
+    column = _metric_column(metric)
+    query = (
+        sqlmodel.select(Reading.id, Reading.ts, column)
+        .where(Reading.grow == grow, Reading.id > after_id, column.is_not(None))
+        .order_by(Reading.id)
+    )
+    return list(session.exec(query).all())
+
+
+def merge_readings(points: list[dict], readings: list[tuple[int, float]], start: int, width: int) -> list[dict]:
+    #Suma lecturas a los puntos del grafico, devuelve solo los puntos que cambiaron o son nuevos
+    by_ts = {point["ts"]: point for point in points}
+    changed = {}
+    for ts, value in readings:
+        bucket_ts = start + (ts - start) // width * width
+        point = changed.get(bucket_ts) or by_ts.get(bucket_ts)
+        if point is None:
+            changed[bucket_ts] = make_point(bucket_ts, value, value, value, 1)
+        else:
+            changed[bucket_ts] = make_point(
+                bucket_ts,
+                min(point["min"], value),
+                max(point["max"], value),
+                point["total"] + value,
+                point["count"] + 1,
+            )
+    return sorted(changed.values(), key=lambda point: point["ts"])
+
+
+def feedings_between(session: sqlmodel.Session, grow: str, start: int, end: int) -> list[Feeding]:
+    query = (
+        sqlmodel.select(Feeding)
+        .where(Feeding.grow == grow, Feeding.ts >= start, Feeding.ts < end)
+        .order_by(Feeding.ts)
+    )
+    return list(session.exec(query).all())
+
+
+def append_reading(grow: str, plant: str, ts: int | None = None, **values) -> Reading:
+    reading = Reading(grow = grow, plant = plant, ts = ts or int(time.time()), **values)
+    with rx.session() as session:
+        session.add(reading)
+        session.commit()
+        session.refresh(reading)
+    return reading
+
+
+def append_feeding(grow: str, plant: str, product: str, ml_per_liter: float, liters: float, ts: int | None = None) -> Feeding:
+    feeding = Feeding(
+        grow = grow,
+        plant = plant,
+        ts = ts or int(time.time()),
+        product = product,
+        ml_per_liter = ml_per_liter,
+        liters = liters,
+    )
+    with rx.session() as session:
+        session.add(feeding)
+        session.commit()
+        session.refresh(feeding)
+    return feeding
+
+
+def create_tables():
+    rx.Model.create_all()
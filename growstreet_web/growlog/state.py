@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import reflex as rx
+from reflex.utils import prerequisites
+
+from growstreet_web.growlog import queries
+
+#Rangos que se pueden elegir en el grafico (dias)
+RANGES = (1, 7, 30, 90)
+
+#Cada cuanto se buscan lecturas nuevas mientras el grafico esta abierto
+POLL_SECONDS = 30
+
+#Cuando la cola tiene mas puntos que esto se pasan a la serie
+MAX_TAIL = 24
+
+
+def _replace_points(points: list[dict], changed: list[dict]) -> list[dict]:
+    by_ts = {point["ts"]: point for point in points}
+    by_ts.update((point["ts"], point) for point in changed)
+    return sorted(by_ts.values(), key=lambda point: point["ts"])
+
+
+#Estado del grafico del registro de cultivo. La serie agregada se envia una
+#vez al abrir el grafico, despues solo cambia `tail` (los ultimos puntos), que
+#es lo unico que viaja al navegador en cada actualizacion
+class GrowLogState(rx.State):
+    grow: str = queries.DEFAULT_GROW
+    metric: str = "ph"
+    range_days: int = 7
+    series: list[dict] = []
+    tail: list[dict] = []
+    feedings: list[dict] = []
+
+    #Inicio del rango y ancho de cada punto (segundos)
+    _start: int = 0
+    _width: int = 1
+    #Id de la ultima lectura incluida en el grafico
+    _last_id: int = 0
+    #Cambia cada vez que se recarga la serie, para cortar el seguimiento anterior
+    _generation: int = 0
+
+    def _load_series(self):
+        self._start, end, self._width = queries.chart_window(self.range_days, int(time.time()))
+        with rx.session() as session:
+            self._last_id = queries.last_reading_id(session)
+            points = queries.downsample(
+                session, self.grow, self.metric, self._start, end, max_id = self._last_id, width = self._width
+            )
+            self.feedings = [
+                dict(
+                    label = queries.point_label(feeding.ts),
+                    plant = feeding.plant,
+                    product = feeding.product,
+                    ml_per_liter = feeding.ml_per_liter,
+                    liters = feeding.liters,
+                )
+                for feeding in queries.feedings_between(session, self.grow, self._start, end)
+            ]
+        #El ultimo punto puede seguir sumando lecturas, por eso va en la cola
+        self.series = points[:-1]
+        self.tail = points[-1:]
+        self._generation += 1
+
+    def load_chart(self):
+        self._load_series()
+        return GrowLogState.follow
+
+    def set_metric(self, metric: str):
+        self.metric = metric
+        return self.load_chart()
+
+    def set_range_days(self, days: int):
+        self.range_days = days
+        return self.load_chart()
+
+    def _merge(self, readings: list[tuple[int, int, float]]):
+        self._last_id = readings[-1][0]
+        #Las lecturas anteriores al rango no se muestran
+        values = [(ts, value) for _, ts, value in readings if ts >= self._start]
+        if not values:
+            return
+        changed = queries.merge_readings(self.series + self.tail, values, self._start, self._width)
+        if self.tail:
+            boundary = self.tail[0]["ts"]
+        else:
+            boundary = self.series[-1]["ts"] + 1 if self.series else self._start
+        late = [point for point in changed if point["ts"] < boundary]
+        recent = [point for point in changed if point["ts"] >= boundary]
+        if late:
+            #Lecturas cargadas tarde (con un ts anterior a la cola): se reenvia la serie
+            self.series = _replace_points(self.series, late)
+        if recent:
+            self.tail = _replace_points(self.tail, recent)
+        if len(self.tail) > MAX_TAIL:
+            #Pocas veces se reenvia la serie completa (sin pasar de MAX_POINTS)
+            self.series = (self.series + self.tail[:-1])[-queries.MAX_POINTS:]
+            self.tail = self.tail[-1:]
+
+    def _connected(self) -> bool:
+        event_namespace = prerequisites.get_app().app.event_namespace
+        return (
+            event_namespace is not None
+            and self.router.session.client_token in event_namespace.token_to_sid
+        )
+
+    @rx.background
+    async def follow(self):
+        #Busca lecturas nuevas y las agrega al grafico hasta que se cierra la
+        #pestaña o se carga otra serie. El estado se lee dentro de `async with self`,
+        #fuera del lock es la copia del momento en que empezo la tarea
+        async with self:
+            generation = self._generation
+        while True:
+            await asyncio.sleep(POLL_SECONDS)
+            async with self:
+                if self._generation != generation or not self._connected():
+                    return
+                grow, metric, last_id = self.grow, self.metric, self._last_id
+            with rx.session() as session:
+                readings = queries.readings_after(session, grow, metric, last_id)
+            if not readings:
+                continue
+            async with self:
+                if self._generation != generation:
+                    return
+                self._merge(readings)
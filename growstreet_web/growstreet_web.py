@@ -2,27 +2,38 @@
 import reflex as rx
 
 import growstreet_web.styles.styles as styles
-from growstreet_web.components.navbar import navbar
+from growstreet_web.styles import atomic
+from growstreet_web.components.layout import app_shell, shared_links
 from growstreet_web.views.header.header import header
-from growstreet_web.views.links.links import links
-from growstreet_web.components.footer import footer
 from growstreet_web.components.products_card import products_card
+from growstreet_web.components.lazy_section import lazy_section
+from growstreet_web.catalog.state import CatalogState
+from growstreet_web.pages.tienda import tienda
+from growstreet_web.pages.guias import guias, guide_page
+from growstreet_web.pages.cultivo import cultivo
+from growstreet_web.pages.calculadora import calculadora
+from growstreet_web.pages.nosotros import nosotros
+from growstreet_web.feed import api as feed_api
+from growstreet_web.growlog import api as growlog_api
+from growstreet_web.serving import metrics, shared_state, static_files
+from growstreet_web.growlog.state import GrowLogState
+from growstreet_web.guides.loader import load_guides
+from growstreet_web.build.compile_cache import CachedApp
 
 
 
 #Importamos el archivo styles como styles para usar sus variables
 import growstreet_web.styles.styles as styles
 
-#Los estados sirven para manejar logica python en la web
-class State(rx.State):
-    pass
+#El estado raiz esta en growstreet_web/state.py
+from growstreet_web.state import State
 
 #Por recomendacion de reflex, la funcion de la pagina principal
 #se llamara index y devolvera un componente reflex
 #Devuelve lo que quiero mostrar por pantalla
 def index() -> rx.Component:
     return rx.box(
-            navbar(),           
+            app_shell(),           
         # BOTON MODO OSCURO rx.color_mode.button(position="top-right", margin = '10px'),
         #Creo un stack en vertical para agrupar los siguientes elementos
             rx.vstack(
@@ -32,24 +43,46 @@ def index() -> rx.Component:
                 align = "center",
                 width = "100%",             
             ),
-            rx.vstack(
-                products_card(),
-                align = "center",
-                   
+            #Lo que esta debajo del header se monta al acercarse a la pantalla
+            lazy_section(
+                rx.vstack(
+                    products_card(),
+                    align = "center",
+                ),
+                placeholder_height = "450px",
             ),
-            rx.vstack(
-                links(),
-                margin_y = styles.Size.BIG.value,
-            ),
-            #Hacer que el footer este en el centro
-            rx.vstack(
-                footer(),
+            lazy_section(
+                rx.vstack(
+                    shared_links(),
+                    class_name = styles.style_section,
+                ),
+                placeholder_height = "200px",
             ),
           )
 
 #Para ejecutar la app debemos definirla
-app = rx.App(
-    style = styles.BASE_STYLE
+#CachedApp solo recompila las paginas que cambiaron, reflex run se encarga de compilar
+app = CachedApp(
+    style = styles.BASE_STYLE,
+    #Clases de CSS atomico de styles.py, CachedApp escribe el archivo al compilar
+    stylesheets = [atomic.STYLESHEET_URL],
 )
 app.add_page(index)
-app._compile()
+app.add_page(tienda, route = "/tienda", title = "Tienda - Grow Street", on_load = CatalogState.load_first_page)
+app.add_page(cultivo, route = "/cultivo", title = "Cultivo actual - Grow Street", on_load = GrowLogState.load_chart)
+app.add_page(calculadora, route = "/calculadora", title = "Calculadora de riego - Grow Street")
+app.add_page(guias, route = "/guias", title = "Guia de cultivo - Grow Street")
+app.add_page(nosotros, route = "/nosotros", title = "Sobre nosotros - Grow Street")
+#Una pagina por cada guia de content/guias
+for guide in load_guides():
+    app.add_page(guide_page(guide), route = guide.route, title = f"{guide.title} - Grow Street", description = guide.description)
+#Carga de lecturas desde los sensores (solo si esta definido GROWLOG_TOKEN)
+growlog_api.register(app)
+#Publicaciones de YouTube e Instagram (GET /api/feed/<canal>) con actualizacion en segundo plano
+feed_api.register(app)
+#Estado de las sesiones en redis para correr varios workers (solo si esta definido REDIS_URL)
+shared_state.register(app)
+#Latencia de los eventos, tamaño de los deltas y conexiones en GET /metrics
+metrics.register(app)
+#Servir el export con cache HTTP desde el backend (solo si esta definido GROWSTREET_STATIC_DIR)
+static_files.register(app)
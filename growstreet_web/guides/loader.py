@@ -0,0 +1,93 @@
+#Carga las guias de cultivo escritas en Markdown (content/guias/*.md).
+#Cada archivo tiene un encabezado con title, description y order, y se divide
+#en secciones por los titulos "## " para poder enlazar y buscar cada una.
+#La ruta (/guias/<slug>) sale de la clave slug del encabezado o del nombre del
+#archivo, siempre pasada por slugify (sin espacios, acentos ni mayusculas).
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+CONTENT_DIR = Path(__file__).resolve().parents[2] / "content" / "guias"
+ROUTE_PREFIX = "/guias"
+
+_FRONT_MATTER = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Section:
+    #El texto antes del primer titulo queda como seccion sin anchor
+    anchor: str
+    title: str
+    body: str
+
+
+@dataclass(frozen=True)
+class Guide:
+    slug: str
+    title: str
+    description: str
+    order: int
+    sections: tuple[Section, ...]
+
+    @property
+    def route(self) -> str:
+        return f"{ROUTE_PREFIX}/{self.slug}"
+
+
+def slugify(text: str) -> str:
+    text = unicodedata.normalize("NFD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _parse_front_matter(text: str) -> tuple[dict, str]:
+    match = _FRONT_MATTER.match(text)
+    if match is None:
+        return {}, text
+    meta = {}
+    for line in match.group(1).splitlines():
+        key, _, value = line.partition(":")
+        meta[key.strip()] = value.strip()
+    return meta, text[match.end():]
+
+
+def _split_sections(body: str) -> tuple[Section, ...]:
+    sections = []
+    title, lines = "", []
+    for line in body.splitlines():
+        if line.startswith("## "):
+            sections.append(Section(slugify(title), title, "\n".join(lines).strip()))
+            title, lines = line[3:].strip(), []
+        else:
+            lines.append(line)
+    sections.append(Section(slugify(title), title, "\n".join(lines).strip()))
+    return tuple(section for section in sections if section.title or section.body)
+
+
+def parse_guide(path: Path) -> Guide:
+    meta, body = _parse_front_matter(path.read_text(encoding="utf-8"))
+    slug = slugify(meta.get("slug") or path.stem)
+    if not slug:
+        raise ValueError(f"La guia {path.name} no tiene un slug valido")
+    return Guide(
+        slug = slug,
+        title = meta.get("title", path.stem),
+        description = meta.get("description", ""),
+        order = int(meta.get("order", 0)),
+        sections = _split_sections(body),
+    )
+
+
+@lru_cache(maxsize=1)
+def load_guides(directory: Path = CONTENT_DIR) -> tuple[Guide, ...]:
+    guides, paths = [], {}
+    for path in sorted(directory.glob("*.md")):
+        guide = parse_guide(path)
+        #Dos archivos con la misma ruta (ej: Floracion.md y floracion.md) no se pisan en silencio
+        if guide.slug in paths:
+            raise ValueError(f"Las guias {paths[guide.slug].name} y {path.name} tienen la misma ruta {guide.route}")
+        paths[guide.slug] = path
+        guides.append(guide)
+    return tuple(sorted(guides, key=lambda guide: (guide.order, guide.slug)))
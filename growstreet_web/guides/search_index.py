@@ -0,0 +1,117 @@
+#Indice invertido de las guias para buscar en el navegador sin pasar por el
+#backend. Se genera al hacer el build y se sirve como archivo estatico.
+#
+#Formato (compacto, listas en lugar de objetos):
+#   docs:     [[ruta, titulo], ...]
+#   sections: [[doc, anchor, titulo], ...]
+#   terms:    {raiz: [seccion, peso, seccion, peso, ...]}
+#   stemmer:  sufijos y stopwords, el buscador del navegador usa los mismos
+#
+#Uso: python -m growstreet_web.build guias
+import json
+import re
+import unicodedata
+from collections import Counter
+
+from growstreet_web.build.images import ASSETS_DIR
+from growstreet_web.guides.loader import Guide, load_guides
+
+INDEX_PATH = ASSETS_DIR / "generated" / "guias_index.json"
+INDEX_URL = "/generated/guias_index.json"
+
+#Las palabras del titulo de la seccion pesan mas que las del texto
+TITLE_WEIGHT = 3
+
+#Largo minimo de la raiz despues de quitar un sufijo
+MIN_STEM_LENGTH = 3
+
+#Sufijos del castellano (sin tildes), se prueba del mas largo al mas corto
+SUFFIXES = tuple(sorted(
+    (
+        "amientos", "imientos", "amiento", "imiento", "aciones", "uciones",
+        "adoras", "adores", "ancias", "encias", "amente", "idades",
+        "mente", "acion", "ucion", "adora", "ador", "ancia", "encia",
+        "idad", "ivas", "ivos", "iva", "ivo", "ables", "ibles", "able", "ible",
+        "istas", "ista", "osos", "osas", "oso", "osa",
+        "ando", "iendo", "ados", "adas", "idos", "idas", "ado", "ada", "ido", "ida",
+        "aron", "ieron", "aban", "amos", "emos", "imos", "aba", "ian", "an", "en", "ia",
+        "ar", "er", "ir", "es", "as", "os", "a", "o", "e", "s",
+    ),
+    key=len,
+    reverse=True,
+))
+
+STOPWORDS = frozenset((
+    "a", "al", "algo", "ante", "antes", "como", "con", "cual", "cuando", "de", "del",
+    "desde", "donde", "durante", "e", "el", "ella", "en", "entre", "es", "esa", "ese",
+    "esta", "este", "esto", "hasta", "hay", "la", "las", "le", "les", "lo", "los",
+    "mas", "mientras", "mucho", "muy", "ni", "no", "o", "para", "pero", "por", "que",
+    "se", "si", "sin", "sobre", "son", "su", "sus", "tambien", "u", "un", "una",
+    "unas", "uno", "unos", "y", "ya",
+))
+
+_WORD = re.compile(r"[a-z0-9]+")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFD", text)
+    return "".join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def stem(word: str) -> str:
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def terms(text: str) -> list[str]:
+    text = _MARKDOWN_LINK.sub(r"\1", text)
+    return [
+        stem(word)
+        for word in _WORD.findall(normalize(text))
+        if word not in STOPWORDS
+    ]
+
+
+def build_index(guides: tuple[Guide, ...]) -> dict:
+    docs, sections = [], []
+    postings: dict[str, list[int]] = {}
+
+    for doc_id, guide in enumerate(guides):
+        docs.append([guide.route, guide.title])
+        for section in guide.sections:
+            section_id = len(sections)
+            sections.append([doc_id, section.anchor, section.title])
+
+            #La primera seccion (sin titulo) toma el titulo y la descripcion de la guia
+            title = section.title or f"{guide.title} {guide.description}"
+            weights = Counter(terms(section.body))
+            for term in terms(title):
+                weights[term] += TITLE_WEIGHT
+
+            for term, weight in sorted(weights.items()):
+                postings.setdefault(term, []).extend((section_id, weight))
+
+    return dict(
+        docs = docs,
+        sections = sections,
+        terms = dict(sorted(postings.items())),
+        stemmer = dict(
+            suffixes = SUFFIXES,
+            stopwords = sorted(STOPWORDS),
+            min_length = MIN_STEM_LENGTH,
+        ),
+    )
+
+
+def main():
+    index = build_index(load_guides())
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    INDEX_PATH.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    print(f"guias: {len(index['docs'])} guias, {len(index['sections'])} secciones, {len(index['terms'])} terminos")
+
+
+if __name__ == "__main__":
+    main()
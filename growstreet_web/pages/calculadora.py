@@ -0,0 +1,20 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.components.feeding_calculator import feeding_calculator
+from growstreet_web.components.layout import app_shell
+from growstreet_web.components.title import title
+from growstreet_web.feeding.dosage import TABLE_URL
+
+def calculadora() -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                title("Calculadora de riego"),
+                rx.text("""Elegi la etapa, la semana, el tamaño de la maceta y la
+                        cantidad de plantas para ver cuanto usar de cada fertilizante."""),
+                #Se calcula en el navegador, sin eventos al backend
+                feeding_calculator(table_url = TABLE_URL),
+                align = "center",
+                class_name = styles.style_page_content,
+            ),
+          )
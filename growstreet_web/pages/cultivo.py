@@ -0,0 +1,82 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.components.layout import app_shell
+from growstreet_web.components.title import title
+from growstreet_web.growlog.queries import METRICS
+from growstreet_web.growlog.state import RANGES, GrowLogState
+
+def option_button(label: str, selected: rx.Var, on_click) -> rx.Component:
+    return rx.button(
+            label,
+            on_click = on_click,
+            variant = rx.cond(selected, "solid", "outline"),
+            color_scheme = "teal",
+            width = "auto",
+        )
+
+def growlog_chart() -> rx.Component:
+    return rx.recharts.line_chart(
+            #La serie se une con los ultimos puntos en el navegador
+            rx.recharts.line(data_key = "avg", name = "Promedio", stroke = styles.Colors.VERDEOSCURO.value, dot = False),
+            rx.recharts.line(data_key = "min", name = "Minimo", stroke = styles.Colors.AZUL.value, dot = False, custom_attrs = {"strokeDasharray": "4 4"}),
+            rx.recharts.line(data_key = "max", name = "Maximo", stroke = styles.Colors.NARANJA.value, dot = False, custom_attrs = {"strokeDasharray": "4 4"}),
+            rx.recharts.x_axis(data_key = "label"),
+            rx.recharts.y_axis(domain = ["auto", "auto"]),
+            rx.recharts.graphing_tooltip(),
+            rx.recharts.legend(),
+            data = GrowLogState.series + GrowLogState.tail,
+            width = "100%",
+            height = 300,
+        )
+
+def feeding_row(feeding: rx.Var) -> rx.Component:
+    return rx.table.row(
+            rx.table.cell(feeding["label"]),
+            rx.table.cell(feeding["plant"]),
+            rx.table.cell(feeding["product"]),
+            rx.table.cell(feeding["ml_per_liter"]),
+            rx.table.cell(feeding["liters"]),
+        )
+
+def cultivo() -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                title("Cultivo actual Mother Gorilla / Royal Queen Seeds"),
+                rx.hstack(
+                    *[
+                        option_button(label, GrowLogState.metric == metric, GrowLogState.set_metric(metric))
+                        for metric, label in METRICS.items()
+                    ],
+                    justify = "center",
+                    wrap = "wrap",
+                ),
+                rx.hstack(
+                    *[
+                        option_button(f"{days} dias", GrowLogState.range_days == days, GrowLogState.set_range_days(days))
+                        for days in RANGES
+                    ],
+                    justify = "center",
+                    wrap = "wrap",
+                ),
+                growlog_chart(),
+                rx.heading("Riegos", size = "4"),
+                rx.table.root(
+                    rx.table.header(
+                        rx.table.row(
+                            rx.table.column_header_cell("Fecha"),
+                            rx.table.column_header_cell("Planta"),
+                            rx.table.column_header_cell("Fertilizante"),
+                            rx.table.column_header_cell("ml/L"),
+                            rx.table.column_header_cell("Litros"),
+                        ),
+                    ),
+                    rx.table.body(
+                        rx.foreach(GrowLogState.feedings, feeding_row),
+                    ),
+                    width = "100%",
+                ),
+                align = "center",
+                class_name = styles.style_page_content,
+            ),
+          )
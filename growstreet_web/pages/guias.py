@@ -0,0 +1,53 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.components.guide_search import guide_search
+from growstreet_web.components.layout import app_shell
+from growstreet_web.components.title import title
+from growstreet_web.guides.loader import Guide, ROUTE_PREFIX, load_guides
+from growstreet_web.guides.search_index import INDEX_URL
+
+def guide_link(guide: Guide) -> rx.Component:
+    return rx.link(
+            rx.card(
+                rx.heading(guide.title, size = "4"),
+                rx.text(guide.description),
+                width = "100%",
+            ),
+            href = guide.route,
+            width = "100%",
+        )
+
+def guias() -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                title("Guia de cultivo"),
+                guide_search(
+                    index_url = INDEX_URL,
+                    placeholder = "Buscar en las guias",
+                ),
+                *[guide_link(guide) for guide in load_guides()],
+                align = "center",
+                class_name = styles.style_page_content,
+            ),
+          )
+
+def guide_page(guide: Guide) -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                rx.link("Volver a las guias", href = ROUTE_PREFIX),
+                title(guide.title),
+                #Cada seccion tiene su anchor para los resultados de busqueda
+                *[
+                    rx.box(
+                        rx.heading(section.title, as_ = "h2", size = "5", id = section.anchor)
+                        if section.title else rx.fragment(),
+                        rx.markdown(section.body),
+                        width = "100%",
+                    )
+                    for section in guide.sections
+                ],
+                class_name = styles.style_page_content,
+            ),
+          )
@@ -0,0 +1,23 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.components.layout import app_shell
+from growstreet_web.components.title import title
+
+#Pagina sin estado, se sirve tambien desde el export estatico
+def nosotros() -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                title("Sobre nosotros"),
+                rx.text("""Grow Street es un proyecto para acompañar a quienes
+                        quieren iniciar en el mundo del cultivo, con contenido
+                        explicativo paso a paso."""),
+                rx.text("""Compartimos cada cultivo en curso, con el registro de
+                        las lecturas y los riegos, y las guias con lo que vamos
+                        aprendiendo en el camino."""),
+                rx.link("Ver el registro del cultivo", href = "/cultivo"),
+                rx.link("Leer la guia de cultivo", href = "/guias"),
+                align = "center",
+                class_name = styles.style_page_content,
+            ),
+          )
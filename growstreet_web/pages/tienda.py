@@ -0,0 +1,57 @@
+import reflex as rx
+import growstreet_web.styles.styles as styles
+from growstreet_web.catalog.queries import STAGES
+from growstreet_web.catalog.state import CatalogState
+from growstreet_web.components.cart import cart_quantity, cart_summary
+from growstreet_web.components.layout import app_shell
+from growstreet_web.components.products_card import product_card, products_grid
+from growstreet_web.components.title import title
+
+def stage_button(label: str, stage: str) -> rx.Component:
+    return rx.button(
+            label,
+            on_click = CatalogState.set_stage(stage),
+            variant = rx.cond(CatalogState.stage == stage, "solid", "outline"),
+            color_scheme = "teal",
+            width = "auto",
+        )
+
+def tienda() -> rx.Component:
+    return rx.box(
+            app_shell(),
+            rx.vstack(
+                title("Tienda"),
+                #Filtros por etapa de cultivo
+                rx.hstack(
+                    stage_button("Todos", ""),
+                    *[stage_button(stage.capitalize(), stage) for stage in STAGES],
+                    justify = "center",
+                    wrap = "wrap",
+                ),
+                cart_summary(),
+                #Solo se renderiza la pagina actual del catalogo
+                products_grid(
+                    rx.foreach(
+                        CatalogState.products,
+                        lambda product: product_card(product, cart_quantity(product)),
+                    ),
+                ),
+                rx.hstack(
+                    rx.button(
+                        "Anterior",
+                        on_click = CatalogState.previous_page,
+                        disabled = ~CatalogState.has_previous,
+                        width = "auto",
+                    ),
+                    rx.button(
+                        "Siguiente",
+                        on_click = CatalogState.next_page,
+                        disabled = ~CatalogState.has_next,
+                        width = "auto",
+                    ),
+                ),
+                align = "center",
+                width = "100%",
+                class_name = styles.style_section,
+            ),
+          )
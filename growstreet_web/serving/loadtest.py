@@ -0,0 +1,216 @@
+#Prueba de carga: N clientes simulados se conectan por websocket al backend con
+#el mismo protocolo que el frontend de reflex (hidratacion, on_load y los eventos
+#que devuelve el servidor) y recorren la pagina principal y el carrito de /tienda.
+#Se mide la latencia de cada evento, desde que se envia hasta el update final,
+#y se muestra el p50/p99 por recorrido y por event handler.
+#
+#Uso (con el backend corriendo, ej: varios workers con REDIS_URL):
+#   pip install aiohttp   (el cliente de socket.io con asyncio lo necesita)
+#   python -m growstreet_web.serving.loadtest --clients 200 --url http://localhost:8000
+#   python -m growstreet_web.serving.loadtest --clients 50 --flows cart --output loadtest.json
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+import socketio
+from reflex import constants
+from reflex.config import get_config
+from reflex.event import get_hydrate_event
+from reflex.state import State as RootState
+
+from growstreet_web.cart.state import CartState
+from growstreet_web.catalog.state import CatalogState
+from growstreet_web.serving.metrics import handler_name
+
+FLOWS = ("index", "cart")
+HYDRATE = get_hydrate_event(RootState)
+ON_LOAD_INTERNAL = f"{RootState.get_name()}.{constants.CompileVars.ON_LOAD_INTERNAL}"
+SET_QUANTITY = f"{CartState.get_full_name()}.set_quantity"
+
+#Tiempo maximo de espera del update final de un evento
+TIMEOUT_SECONDS = 30
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class SimulatedClient:
+
+    def __init__(self, url: str, latencies: dict[str, list[float]]):
+        self.url = url
+        self.latencies = latencies
+        #Cada cliente es una sesion distinta (su propio estado y su propio lock)
+        self.token = str(uuid.uuid4())
+        self.namespace = get_config().get_event_namespace()
+        self.updates = asyncio.Queue()
+        self.sio = socketio.AsyncClient(reconnection = False)
+        self.sio.on("event", self.updates.put_nowait, namespace = self.namespace)
+
+    async def connect(self):
+        #Solo websocket, igual que el backend en modo escalado (serving/shared_state.py)
+        await self.sio.connect(
+            self.url,
+            namespaces = [self.namespace],
+            socketio_path = self.namespace,
+            transports = ["websocket"],
+        )
+
+    async def disconnect(self):
+        await self.sio.disconnect()
+
+    async def send(self, flow: str, path: str, name: str, payload: dict | None = None) -> dict:
+        #Como el frontend: un evento por vez y los que devuelve el servidor (ej: on_load) se encolan
+        queue = [(name, payload or {})]
+        deltas = {}
+        while queue:
+            name, payload = queue.pop(0)
+            start = time.perf_counter()
+            await self.sio.emit(
+                "event",
+                json.dumps(dict(
+                    name = name,
+                    payload = payload,
+                    token = self.token,
+                    router_data = dict(pathname = path, query = {}, asPath = path),
+                )),
+                namespace = self.namespace,
+            )
+            while True:
+                update = json.loads(await asyncio.wait_for(self.updates.get(), TIMEOUT_SECONDS))
+                for state_name, delta in (update.get("delta") or {}).items():
+                    deltas.setdefault(state_name, {}).update(delta)
+                #Los eventos que empiezan con _ (ej: _redirect) los resuelve el navegador
+                queue.extend(
+                    (event["name"], event.get("payload") or {})
+                    for event in update.get("events") or []
+                    if not event["name"].startswith("_")
+                )
+                if update.get("final", True):
+                    break
+            seconds = time.perf_counter() - start
+            self.latencies[flow].append(seconds)
+            self.latencies[handler_name(name)].append(seconds)
+        return deltas
+
+    async def load_page(self, flow: str, path: str) -> dict:
+        deltas = await self.send(flow, path, HYDRATE)
+        deltas.update(await self.send(flow, path, ON_LOAD_INTERNAL))
+        return deltas
+
+    async def index_flow(self):
+        await self.load_page("index", "/")
+
+    async def cart_flow(self, cart_events: int):
+        deltas = await self.load_page("cart", "/tienda")
+        products = deltas.get(CatalogState.get_full_name(), {}).get("products") or []
+        product_ids = [product["id"] for product in products] or [1]
+        for _ in range(cart_events):
+            await self.send("cart", "/tienda", SET_QUANTITY, dict(
+                product_id = random.choice(product_ids),
+                quantity = random.randint(0, 5),
+            ))
+
+
+async def run_client(url: str, flows: list[str], cart_events: int, delay: float, latencies, errors: list[str]):
+    await asyncio.sleep(delay)
+    client = SimulatedClient(url, latencies)
+    try:
+        await client.connect()
+        if "index" in flows:
+            await client.index_flow()
+        if "cart" in flows:
+            await client.cart_flow(cart_events)
+    except Exception as error:
+        errors.append(f"{type(error).__name__}: {error}")
+    finally:
+        if client.sio.connected:
+            await client.disconnect()
+
+
+async def run_load_test(url: str, clients: int, flows: list[str], cart_events: int, ramp_seconds: float) -> dict:
+    latencies = defaultdict(list)
+    errors = []
+    start = time.perf_counter()
+    #Las conexiones se reparten a lo largo de ramp_seconds para no abrir todas en el mismo instante
+    await asyncio.gather(*(
+        run_client(url, flows, cart_events, ramp_seconds * index / clients, latencies, errors)
+        for index in range(clients)
+    ))
+    seconds = time.perf_counter() - start
+
+    #Cada evento se cuenta en su recorrido y en su handler, el total sale de los recorridos
+    all_values = [value for flow in flows for value in latencies[flow]]
+    return dict(
+        url = url,
+        clients = clients,
+        seconds = seconds,
+        events = len(all_values),
+        events_per_second = len(all_values) / seconds if seconds else 0,
+        errors = errors,
+        latency_ms = {
+            name: dict(
+                count = len(values),
+                p50 = percentile(values, 0.50) * 1000,
+                p99 = percentile(values, 0.99) * 1000,
+            )
+            for name, values in sorted(latencies.items())
+            if values
+        },
+        total_ms = dict(
+            p50 = percentile(all_values, 0.50) * 1000,
+            p99 = percentile(all_values, 0.99) * 1000,
+        ) if all_values else None,
+    )
+
+
+def print_report(results: dict, flows: list[str]):
+    print(
+        f"loadtest: {results['clients']} clientes, {results['events']} eventos en {results['seconds']:.1f}s "
+        f"({results['events_per_second']:.0f}/s), {len(results['errors'])} errores"
+    )
+    rows = [(name, values) for name, values in results["latency_ms"].items() if name in flows]
+    rows += [(name, values) for name, values in results["latency_ms"].items() if name not in flows]
+    for name, values in rows:
+        print(f"  {name:<40} p50 {values['p50']:8.1f} ms   p99 {values['p99']:8.1f} ms   ({values['count']} eventos)")
+    if results["total_ms"] is not None:
+        print(f"  {'total':<40} p50 {results['total_ms']['p50']:8.1f} ms   p99 {results['total_ms']['p99']:8.1f} ms")
+    for error in sorted(set(results["errors"]))[:10]:
+        print(f"  error: {error}")
+
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser(prog = "python -m growstreet_web.serving.loadtest")
+    parser.add_argument("--url", default = get_config().api_url, help = "URL del backend")
+    parser.add_argument("--clients", type = int, default = 50, help = "cantidad de clientes simulados")
+    parser.add_argument("--flows", nargs = "+", choices = FLOWS, default = list(FLOWS))
+    parser.add_argument("--cart-events", type = int, default = 10, help = "cambios de cantidad por cliente en /tienda")
+    parser.add_argument("--ramp", type = float, default = 5.0, help = "segundos en los que se conectan todos los clientes")
+    parser.add_argument("--output", help = "guardar los resultados en un JSON")
+    args = parser.parse_args(argv)
+
+    #aiohttp es opcional, solo lo usa el cliente de socket.io de la prueba de carga
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        sys.exit("loadtest: falta aiohttp, instalar con `pip install aiohttp`")
+
+    results = asyncio.run(run_load_test(args.url, args.clients, args.flows, args.cart_events, args.ramp))
+    print_report(results, args.flows)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=1))
+        print(f"loadtest: resultados en {args.output}")
+    if results["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
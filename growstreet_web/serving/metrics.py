@@ -0,0 +1,196 @@
+#Metricas del backend en formato de texto de Prometheus (GET /metrics):
+#   - growstreet_event_seconds: latencia de cada event handler (histograma)
+#   - growstreet_delta_bytes: tamaño del delta que se envia por el websocket
+#   - growstreet_state_lock_wait_seconds: espera del lock del estado de la sesion
+#     (incluye leer el estado, ej: desde redis)
+#   - growstreet_active_connections / growstreet_background_tasks
+#Cada worker tiene sus propias metricas, Prometheus tiene que leer cada uno.
+#
+#Perfilado opcional: con GROWSTREET_PROFILE_SAMPLE=0.05 se perfila (cProfile) el
+#5% de los eventos, y si tardan mas de GROWSTREET_PROFILE_SLOW_MS (200 por
+#defecto) se guarda el .prof en GROWSTREET_PROFILE_DIR (profiles/ por defecto).
+import bisect
+import contextlib
+import contextvars
+import cProfile
+import os
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import reflex as rx
+from fastapi.responses import PlainTextResponse
+from reflex.event import get_hydrate_event
+from reflex.middleware import Middleware
+from reflex.utils import format
+
+METRICS_ROUTE = "/metrics"
+
+#Limites de los buckets de cada histograma
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+PROFILE_SAMPLE_ENV = "GROWSTREET_PROFILE_SAMPLE"
+PROFILE_SLOW_MS_ENV = "GROWSTREET_PROFILE_SLOW_MS"
+PROFILE_DIR_ENV = "GROWSTREET_PROFILE_DIR"
+
+
+class Histogram:
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        #{handler: [cantidad por bucket (el ultimo es +Inf), suma]}
+        self.series = defaultdict(lambda: [[0] * (len(buckets) + 1), 0.0])
+
+    def observe(self, handler: str, value: float):
+        counts, total = self.series[handler]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.series[handler][1] = total + value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for handler, (counts, total) in sorted(self.series.items()):
+            #Sin handler (ej: el lock del estado) la serie va sin label
+            label = f'handler="{handler}"' if handler else ""
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                bucket_labels = f'{label},le="{bound}"' if label else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            suffix = f"{{{label}}}" if label else ""
+            lines.append(f"{self.name}_sum{suffix} {total}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+event_seconds = Histogram(
+    "growstreet_event_seconds", "Latencia de cada event handler.", LATENCY_BUCKETS
+)
+delta_bytes = Histogram(
+    "growstreet_delta_bytes", "Tamaño del delta enviado por el websocket.", SIZE_BUCKETS
+)
+lock_wait_seconds = Histogram(
+    "growstreet_state_lock_wait_seconds", "Espera del lock del estado de la sesion.", LATENCY_BUCKETS
+)
+
+#Evento en curso: lo crea modify_state (instrument_state_manager) al tomar el lock
+#del estado y lo completa el middleware ({start, handler, profile}). Dura lo que
+#dura el evento, no queda nada guardado por token si el cliente se desconecta
+_current_event: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
+    "growstreet_current_event", default=None
+)
+_profiling = False
+
+
+def handler_name(event_name: str) -> str:
+    #"reflex___state____state.growstreet_web___cart...____cart_state.set_quantity" -> "cart_state.set_quantity"
+    *states, handler = event_name.split(".")
+    state = states[-1].rsplit("___", 1)[-1] if states else ""
+    return f"{state}.{handler}" if state else handler
+
+
+def _start_profile() -> cProfile.Profile | None:
+    global _profiling
+    sample = float(os.environ.get(PROFILE_SAMPLE_ENV, "0") or 0)
+    #cProfile no admite dos perfiles activos a la vez
+    if _profiling or sample <= 0 or random.random() >= sample:
+        return None
+    _profiling = True
+    profile = cProfile.Profile()
+    profile.enable()
+    return profile
+
+
+def _finish_profile(profile: cProfile.Profile, handler: str, seconds: float):
+    global _profiling
+    profile.disable()
+    _profiling = False
+    slow_ms = float(os.environ.get(PROFILE_SLOW_MS_ENV, "200"))
+    if seconds * 1000 < slow_ms:
+        return
+    directory = Path(os.environ.get(PROFILE_DIR_ENV, "profiles"))
+    directory.mkdir(parents=True, exist_ok=True)
+    #Ver con: python -m pstats profiles/<archivo>.prof
+    profile.dump_stats(directory / f"{handler}-{int(time.time() * 1000)}.prof")
+
+
+class MetricsMiddleware(Middleware):
+
+    async def preprocess(self, app, state, event):
+        #La hidratacion (la responde HydrateMiddleware) y los eventos en segundo plano no pasan por postprocess
+        if event.name == get_hydrate_event(state):
+            return None
+        _, handler = state._get_event_handler(event)
+        current = _current_event.get()
+        if current is not None and not handler.is_background:
+            #El perfil lo cierra modify_state al soltar el lock, aunque no llegue el postprocess
+            current.update(start = time.perf_counter(), handler = handler_name(event.name), profile = _start_profile())
+        return None
+
+    async def postprocess(self, app, state, event, update):
+        name = handler_name(event.name)
+        if update.delta:
+            delta_bytes.observe(name, len(format.json_dumps(update.delta)))
+        #Un handler que hace yield manda varios updates, el ultimo es final
+        current = _current_event.get()
+        if update.final and current is not None and "start" in current:
+            event_seconds.observe(name, time.perf_counter() - current["start"])
+        return update
+
+
+def instrument_state_manager(state_manager):
+    original = state_manager.modify_state
+
+    @contextlib.asynccontextmanager
+    async def modify_state(token: str):
+        start = time.perf_counter()
+        async with original(token) as state:
+            lock_wait_seconds.observe("", time.perf_counter() - start)
+            current = {}
+            _current_event.set(current)
+            try:
+                yield state
+            finally:
+                #Se desactiva aunque el evento no termine (ej: el cliente se desconecta a mitad del handler)
+                if current.get("profile") is not None:
+                    _finish_profile(current["profile"], current["handler"], time.perf_counter() - current["start"])
+
+    #StateManager es un modelo de pydantic, no admite atributos nuevos con setattr
+    object.__setattr__(state_manager, "modify_state", modify_state)
+
+
+def render(app: rx.App) -> str:
+    event_namespace = app.event_namespace
+    connections = len(event_namespace.token_to_sid) if event_namespace is not None else 0
+    lines = [
+        "# HELP growstreet_active_connections Clientes conectados por websocket a este worker.",
+        "# TYPE growstreet_active_connections gauge",
+        f"growstreet_active_connections {connections}",
+        "# HELP growstreet_background_tasks Tareas en segundo plano en curso.",
+        "# TYPE growstreet_background_tasks gauge",
+        f"growstreet_background_tasks {len(app.background_tasks)}",
+    ]
+    for histogram in (event_seconds, delta_bytes, lock_wait_seconds):
+        lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+def register(app: rx.App):
+    #Primero: el postprocess de reflex corta en el primer middleware que devuelve el update
+    app.add_middleware(MetricsMiddleware(), index = 0)
+
+    async def metrics():
+        return PlainTextResponse(render(app), media_type="text/plain; version=0.0.4")
+
+    app.api.add_api_route(METRICS_ROUTE, metrics, methods=["GET"])
+
+    #El state manager se crea junto con la app, se instrumenta al arrancar el servidor
+    @contextlib.asynccontextmanager
+    async def instrument():
+        instrument_state_manager(app.state_manager)
+        yield
+
+    app.register_lifespan_task(instrument)
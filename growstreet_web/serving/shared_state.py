@@ -0,0 +1,163 @@
+#Modo escalado horizontal: con REDIS_URL definido el estado de cada sesion vive
+#en redis y cualquier worker (o cualquier maquina detras del balanceador) puede
+#atender cualquier evento, sin sticky sessions:
+#   - el websocket es el unico transporte, el long-polling de socket.io guarda la
+#     sesion en la memoria del worker y necesitaria sticky sessions
+#   - al leer el estado se piden todos los subestados necesarios con un solo MGET
+#     (reflex hace un GET por subestado, un nivel del arbol por vez)
+#   - al guardar se escriben los subestados modificados en una sola transaccion
+#     (MULTI/EXEC) que solo se aplica si el lock sigue siendo de este evento
+#   - el lock es por sesion ({token}_lock), las sesiones distintas no se esperan
+#
+#Uso:
+#   REDIS_URL=redis://localhost:6379 GUNICORN_WORKERS=4 reflex run --env prod --backend-only
+#   (varias maquinas pueden apuntar al mismo redis)
+import contextvars
+
+import dill
+import reflex as rx
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+from reflex.config import get_config
+from reflex.state import (
+    BaseState,
+    LockExpiredError,
+    StateManagerRedis,
+    _split_substate_key,
+    _substate_key,
+)
+from reflex.utils import prerequisites
+
+#Subestados leidos con MGET para la lectura en curso ({clave: valor o None si no existe})
+_prefetched: contextvars.ContextVar[dict[str, bytes | None] | None] = contextvars.ContextVar(
+    "growstreet_prefetched_states", default=None
+)
+
+
+class PrefetchingRedis(Redis):
+
+    #StateManagerRedis lee cada subestado con get(), se responde desde el MGET si ya se leyo
+    async def get(self, name):
+        prefetched = _prefetched.get()
+        key = name.decode() if isinstance(name, bytes) else name
+        if prefetched is not None and key in prefetched:
+            return prefetched[key]
+        return await super().get(name)
+
+
+def _needed_states(state_cls: type[BaseState], all_substates: bool) -> set[str]:
+    #Los mismos subestados que recorre StateManagerRedis._populate_substates
+    names = {state_cls.get_full_name()}
+    substates = state_cls.get_substates() if all_substates else state_cls._potentially_dirty_substates()
+    for substate in substates:
+        names |= _needed_states(substate, all_substates)
+    return names
+
+
+class PipelinedStateManagerRedis(StateManagerRedis):
+
+    def prefetch_keys(self, token: str, get_substates: bool = True) -> list[str]:
+        client_token, state_path = _split_substate_key(token)
+        state_cls = self.state.get_class_substate(state_path)
+        names = _needed_states(state_cls, get_substates)
+        #Los padres se leen sin todos sus subestados, solo los que pueden recalcular vars
+        parent = state_cls.get_parent_state()
+        while parent is not None:
+            names |= _needed_states(parent, False)
+            parent = parent.get_parent_state()
+        return [_substate_key(client_token, name) for name in sorted(names)]
+
+    async def get_state(
+        self,
+        token: str,
+        top_level: bool = True,
+        get_substates: bool = True,
+        parent_state: BaseState | None = None,
+    ) -> BaseState:
+        _, state_path = _split_substate_key(token)
+        #Las lecturas anidadas (padres y subestados) usan el MGET de la primera
+        if not state_path or _prefetched.get() is not None:
+            return await super().get_state(token, top_level, get_substates, parent_state)
+
+        keys = self.prefetch_keys(token, get_substates)
+        values = await self.redis.mget(keys)
+        reset = _prefetched.set(dict(zip(keys, values)))
+        try:
+            return await super().get_state(token, top_level, get_substates, parent_state)
+        finally:
+            _prefetched.reset(reset)
+
+    def _touched_states(self, client_token: str, state: BaseState, writes: dict[str, bytes]) -> dict[str, bytes]:
+        for substate in state.substates.values():
+            self._touched_states(client_token, substate, writes)
+        #Igual que reflex: solo se guardan los subestados que cambiaron
+        if state._get_was_touched():
+            pickle_state = dill.dumps(state, byref=True)
+            self._warn_if_too_large(state, len(pickle_state))
+            writes[_substate_key(client_token, state)] = pickle_state
+        return writes
+
+    async def set_state(
+        self,
+        token: str,
+        state: BaseState,
+        lock_id: bytes | None = None,
+    ):
+        client_token, substate_name = _split_substate_key(token)
+        if state.parent_state is not None and state.get_full_name() != substate_name:
+            raise RuntimeError(
+                f"Cannot `set_state` with mismatching token {token} and substate {state.get_full_name()}."
+            )
+        writes = self._touched_states(client_token, state, {})
+        #Un evento que no cambio nada no escribe en redis
+        if not writes:
+            return
+
+        lock_key = self._lock_key(token)
+        async with self.redis.pipeline(transaction = True) as pipe:
+            try:
+                if lock_id is not None:
+                    #Si otro evento toma el lock entre el WATCH y el EXEC la transaccion no se aplica
+                    await pipe.watch(lock_key)
+                    if await pipe.get(lock_key) != lock_id:
+                        raise self._lock_expired(token)
+                    pipe.multi()
+                for key, pickle_state in writes.items():
+                    pipe.set(key, pickle_state, ex = self.token_expiration)
+                await pipe.execute()
+            except WatchError:
+                raise self._lock_expired(token) from None
+
+    def _lock_expired(self, token: str) -> LockExpiredError:
+        return LockExpiredError(
+            f"Vencio el lock de {token} mientras se procesaba el evento. Aumentar "
+            f"redis_lock_expiration en rxconfig.py (hoy {self.lock_expiration} ms) "
+            "o usar @rx.background para las tareas largas."
+        )
+
+
+def _redis_client() -> PrefetchingRedis | None:
+    #Mismos formatos de REDIS_URL que acepta reflex (redis://... o host:puerto)
+    options = prerequisites.parse_redis_url()
+    if isinstance(options, str):
+        return PrefetchingRedis.from_url(options)
+    if isinstance(options, dict):
+        return PrefetchingRedis(**options)
+    return None
+
+
+def register(app: rx.App):
+    redis = _redis_client()
+    #Sin REDIS_URL (ej: reflex run en desarrollo) queda el estado en memoria del proceso
+    if redis is None or app.state is None:
+        return
+    config = get_config()
+    app._state_manager = PipelinedStateManagerRedis(
+        state = app.state,
+        redis = redis,
+        token_expiration = config.redis_token_expiration,
+        lock_expiration = config.redis_lock_expiration,
+    )
+    #El frontend intenta primero el websocket, sin long-polling no hacen falta sticky sessions
+    if app.sio is not None:
+        app.sio.eio.transports = ["websocket"]
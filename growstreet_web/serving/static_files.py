@@ -0,0 +1,129 @@
+#Servidor de archivos estaticos con cache HTTP para el export del frontend:
+#   - Archivos con hash de contenido en el nombre (_next/static/, optimized/):
+#     Cache-Control immutable por un año, el navegador no vuelve a preguntar.
+#   - El resto (HTML, JSON generados, imagenes originales): ETag fuerte (sha256
+#     del contenido) y respuesta 304 si el navegador ya tiene esa version.
+#   - Si el navegador acepta br o gzip se envia la version comprimida en el
+#     build (python -m growstreet_web.build http), sin comprimir en cada request.
+#
+#Para servir el export desde el backend (ej: un solo proceso detras del proxy):
+#   GROWSTREET_STATIC_DIR=.web/_static reflex run --env prod --backend-only
+import contextlib
+import json
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+import reflex as rx
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+
+STATIC_DIR_ENV = "GROWSTREET_STATIC_DIR"
+
+#Encodings precomprimidos en orden de preferencia y la extension de su archivo
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+#Tipos de archivo que vale la pena comprimir (las imagenes ya vienen comprimidas)
+TEXT_SUFFIXES = {".html", ".js", ".css", ".json", ".svg", ".txt", ".xml", ".map", ".ico"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+#Next.js pone el hash en la ruta de _next/static/, el paso "images" en el nombre
+_HASHED = re.compile(r"^_next/static/|\.[0-9a-f]{10}\.[a-z0-9]+$")
+
+
+def is_immutable(relative: str) -> bool:
+    return bool(_HASHED.search(relative))
+
+
+def manifest_path(root: Path) -> Path:
+    #Al lado de la carpeta (no adentro) para que no se sirva como un archivo mas
+    return root.with_name(f"{root.name}.http.json")
+
+
+def load_manifest(root: Path) -> dict:
+    path = manifest_path(root)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def _accepted(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class CachedStaticFiles(StaticFiles):
+
+    def __init__(self, directory: str | os.PathLike, **kwargs):
+        super().__init__(directory = directory, html = True, **kwargs)
+        self.root = Path(directory).resolve()
+        #{ruta relativa: {etag, encodings}} generado por el paso "http" del build
+        self.manifest = load_manifest(self.root)
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        relative = Path(full_path).resolve().relative_to(self.root).as_posix()
+        entry = self.manifest.get(relative)
+        #Archivos que no estaban en el build (ej: se copiaron despues) se sirven como siempre
+        if entry is None:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope = scope)
+        accepted = _accepted(request_headers.get("accept-encoding", ""))
+        encoding, suffix = next(
+            ((name, suffix) for name, suffix in ENCODINGS if name in entry["encodings"] and name in accepted),
+            (None, ""),
+        )
+
+        #Cada representacion (sin comprimir, br, gzip) tiene su propio ETag fuerte
+        etag = f'"{entry["etag"]}-{encoding}"' if encoding else f'"{entry["etag"]}"'
+        headers = {
+            "etag": etag,
+            "cache-control": IMMUTABLE if is_immutable(relative) else REVALIDATE,
+        }
+        if entry["encodings"]:
+            headers["vary"] = "Accept-Encoding"
+
+        if _matches(request_headers.get("if-none-match", ""), etag):
+            return Response(status_code = 304, headers = headers)
+
+        path = f"{full_path}{suffix}"
+        response = FileResponse(
+            path,
+            status_code = status_code,
+            headers = headers,
+            media_type = mimetypes.guess_type(str(full_path))[0] or "application/octet-stream",
+            stat_result = os.stat(path) if suffix else stat_result,
+        )
+        if encoding:
+            response.headers["content-encoding"] = encoding
+        return response
+
+
+def register(app: rx.App):
+    directory = os.environ.get(STATIC_DIR_ENV)
+    if not directory:
+        return
+
+    #Se monta al arrancar, despues de todas las rutas del backend (/_event, /ping,
+    #/_upload, /api/...), porque un mount en "/" atiende todo lo que llega a el
+    @contextlib.asynccontextmanager
+    async def mount_static_files(app: FastAPI):
+        app.mount("/", CachedStaticFiles(directory), name = "static_files")
+        yield
+
+    app.register_lifespan_task(mount_static_files)
@@ -0,0 +1,7 @@
+import reflex as rx
+
+#Los estados sirven para manejar logica python en la web.
+#Esta en su propio modulo para que los subestados (ej: el carrito) lo puedan
+#importar sin importar la app
+class State(rx.State):
+    pass
@@ -0,0 +1,107 @@
+#CSS atomico: cada par propiedad/valor de estilo fijo se convierte en una clase
+#(ej: atomic(width = "300px") -> "a-3f2c1b") y todas las clases se escriben
+#una sola vez en un archivo CSS al compilar. Las cards de una grilla comparten
+#la misma clase en lugar de llevar cada una su objeto de estilo de emotion, que
+#se arma y hashea en el navegador al hidratar.
+#
+#Solo para valores fijos: lo que depende del estado (Vars), pseudo selectores
+#(_hover) y estilos responsivos (listas) se siguen pasando como props.
+import hashlib
+from enum import Enum
+from pathlib import Path
+
+from reflex.style import STYLE_PROP_SHORTHAND_MAPPING
+from reflex.utils import format
+
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+STYLESHEET = "generated/atomic.css"
+#Ruta para app.stylesheets (relativa a assets/)
+STYLESHEET_URL = f"/{STYLESHEET}"
+
+CLASS_PREFIX = "a-"
+
+#{clase: (propiedad css, valor)} de todas las clases usadas por los componentes
+_rules: dict[str, tuple[str, str]] = {}
+
+#Enums cuyos valores se escriben como custom properties en :root
+_variables: dict[str, str] = {}
+
+
+def variable_name(member: Enum) -> str:
+    return f"--{format.to_kebab_case(type(member).__name__)}-{member.name.lower().replace('_', '-')}"
+
+
+class CSSVariableEnum(Enum):
+
+    #Referencia a la custom property, ej: Colors.AZUL.var -> "var(--colors-azul)"
+    @property
+    def var(self) -> str:
+        name = variable_name(self)
+        _variables[name] = str(self.value)
+        return f"var({name})"
+
+
+def css_variables(enum: type[CSSVariableEnum]) -> type[CSSVariableEnum]:
+    #Registra todos los valores del enum en :root (ej: --size-big), aunque no se usen en atomic
+    for member in enum:
+        member.var
+    return enum
+
+
+def _css_value(value) -> str:
+    if isinstance(value, CSSVariableEnum):
+        return value.var
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError(f"atomic solo acepta valores fijos, no {type(value).__name__}: {value!r}")
+
+
+def _properties(prop: str) -> tuple[str, ...]:
+    #Mismos atajos que reflex (padding_x, margin_y, bg, ...)
+    camel = format.to_camel_case(prop)
+    return tuple(
+        format.to_kebab_case(name) if not name.startswith("--") else name
+        for name in STYLE_PROP_SHORTHAND_MAPPING.get(camel, (camel,))
+    )
+
+
+def atomic(**props) -> str:
+    classes = []
+    for prop, value in props.items():
+        value = _css_value(value)
+        for css_property in _properties(prop):
+            digest = hashlib.sha256(f"{css_property}:{value}".encode()).hexdigest()[:6]
+            name = f"{CLASS_PREFIX}{digest}"
+            _rules[name] = (css_property, value)
+            if name not in classes:
+                classes.append(name)
+    return " ".join(classes)
+
+
+def stylesheet() -> str:
+    lines = ["/* Generado por growstreet_web/styles/atomic.py, no editar */", ":root {"]
+    lines.extend(f"  {name}: {value};" for name, value in sorted(_variables.items()))
+    lines.append("}")
+    #La clase repetida sube la especificidad por encima de los estilos por
+    #defecto de Radix sin importar el orden en que se cargan las hojas
+    lines.extend(
+        f".{name}.{name} {{ {css_property}: {value}; }}"
+        for name, (css_property, value) in sorted(_rules.items())
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_stylesheet(*directories: Path) -> bool:
+    #Solo se escribe si cambio, para no disparar el hot reload de Next sin motivo
+    content = stylesheet()
+    changed = False
+    for directory in (ASSETS_DIR, *directories):
+        path = directory / STYLESHEET
+        if path.exists() and path.read_text() == content:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        changed = True
+    return changed
@@ -1,6 +1,5 @@
 import reflex as rx
-from enum import Enum
-from growstreet_web.views.header.header import header
+from growstreet_web.styles.atomic import CSSVariableEnum, atomic, css_variables
 
 #Defino una constante para poder usarla cuando quieras.
 
@@ -8,14 +7,17 @@ from growstreet_web.views.header.header import header
 MAX_WIDTH = "600px"
 
 #Creamos la clase para definir las constantes
-class Size(Enum):
+#Los valores tambien se escriben como custom properties de CSS (Size.BIG.var -> var(--size-big))
+@css_variables
+class Size(CSSVariableEnum):
     #Sizes
     SMALL = "0.5em"
     MEDIUM = "0.8em"
     DEFAULT = "1em"
     BIG = "2em"
 
-class Colors(Enum):
+@css_variables
+class Colors(CSSVariableEnum):
     #Pallet Colors
     AZUL = "#0B7099"
     VERDEAZULADO = "#57BF98"
@@ -37,34 +39,86 @@ BASE_STYLE = {
     }
 }
 
+#Los estilos fijos son clases de CSS atomico (styles/atomic.py), se usan con
+#class_name = styles.style_... en lugar de style = ...
+
 #Estilos para botones especificos
-style_button_links = dict(
+style_button_links = atomic(
     # Alinear el contenido al inicio
-    justifyContent = "start",
+    justify_content = "start",
 )
 
 #Configuracion para titulos
-style_title = dict(
+style_title = atomic(
     #Toma todo el bloque de linea
     width = "100%",
     #Para no usar align en el componente
-    textAlign = "center",
+    text_align = "center",
     #Para no usar size en el componente retocamos la fuente
     font_size = Size.DEFAULT,
     #Color del texto
-    color = Colors.NARANJA
+    color = Colors.NARANJA,
 )
 
 
 #Para crear un estilo especifico para un componente
-style_button_title = dict(
-    font_size = Size.MEDIUM.value,
+style_button_title = atomic(
+    font_size = Size.MEDIUM,
+)
+style_button_subtitle = atomic(
+    font_size = Size.SMALL,
+)
+
+style_footer = atomic(
+    bg = Colors.NARANJA,
+    width = "100%",
+    margin_top = "20px",
+    padding = Size.SMALL,
+)
+
+style_navbar = atomic(
+    position = "sticky",
+    top = "0",
+    z_index = "999",
+    bg = Colors.AZUL,
+    padding_x = Size.DEFAULT,
+    padding_y = Size.SMALL,
+)
+
+#Links de la navbar (components/prefetch_link.py, no pasan por el estilo de rx.link)
+style_nav_link = atomic(
+    text_decoration = "none",
 )
-style_button_subtitle = dict(
-    font_size = Size.SMALL.value,
+
+#Iconos de las redes y del logo de la navbar
+style_icon = atomic(
+    width = Size.BIG,
+    height = Size.BIG,
+)
+
+#Cards de productos
+style_product_card = atomic(
+    width = "300px",
 )
 
-style_footer = dict(
-    bg = Colors.NARANJA.value,
+#Bloque central de las paginas (guias, calculadora, registro del cultivo)
+style_page_content = atomic(
+    margin_x = "auto",
+    max_width = MAX_WIDTH,
+    padding = Size.DEFAULT,
     width = "100%",
 )
+
+style_section = atomic(
+    margin_y = Size.BIG,
+)
+
+style_header = atomic(
+    margin_x = Size.DEFAULT,
+)
+
+#Seccion del cultivo actual en el header
+style_grow_section = atomic(
+    background_color = "var(--pink-2)",
+    padding = Size.BIG,
+)
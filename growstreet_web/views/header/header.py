@@ -1,11 +1,13 @@
 import reflex as rx
 import growstreet_web.styles.styles as styles
+from growstreet_web.components.optimized_image import optimized_image
 from growstreet_web.components.title import title
 
 def header() -> rx.Component:
     return rx.vstack(
-            rx.image(src="grow_street_logo.png",
-                height = "400px"),
+            optimized_image(src="grow_street_logo.png",
+                height = "400px",
+                alt = "Grow Street"),
             title("Bienvenidos a Grow Street"),
             rx.text("""Nuestro contenido es explicativo 
                     para guiar a personas que quieran iniciar 
@@ -17,9 +19,10 @@ def header() -> rx.Component:
                     del banco Royal Queen"""),
             rx.text("""En todo este proceso utilizamos los siguientes
             fertilizantes""", align = "center"),
-                background_color="var(--pink-2)",
-                padding = styles.Size.BIG.value
+            rx.link("Ver el registro del cultivo", href = "/cultivo"),
+            rx.link("Calcular las dosis de riego", href = "/calculadora"),
+                class_name = styles.style_grow_section,
             ),
-            margin_x = styles.Size.DEFAULT.value,
+            class_name = styles.style_header,
             align = "center",
             )
\ No newline at end of file
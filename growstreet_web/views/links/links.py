@@ -1,5 +1,8 @@
 import reflex as rx
+from growstreet_web.components.feed_list import feed_list
 from growstreet_web.components.link_button import link_button
+from growstreet_web.feed.api import feed_url
+from growstreet_web.feed.providers import CHANNELS
 
 def links() -> rx.Component:
     return rx.vstack(
@@ -29,11 +32,25 @@ def links() -> rx.Component:
                 #El bloque que contiene los botones de links
                 width = "100%",          
                 ),
+                #Ultimas publicaciones, se leen del cache del backend
+                rx.hstack(
+                    feed_list(
+                        feed_url = feed_url("youtube"),
+                        channel_url = CHANNELS["youtube"],
+                        label = "Ver todos los videos",
+                    ),
+                    feed_list(
+                        feed_url = feed_url("instagram"),
+                        channel_url = CHANNELS["instagram"],
+                        label = "Ver todas las publicaciones",
+                    ),
+                    width = "100%",
+                    wrap = "wrap",
+                ),
 
                 #Bloque que esta por fuera de los links
                 width = "100%",
                 align = "center",
                 padding_x = "10%",
               
-            ),
-
+            )
@@ -5,4 +5,4 @@ def links_icon() -> rx.Component:
     return rx.hstack(
                 link_icon("instagram","https://instagram.com/grow.street.cultivo"),
                 link_icon("youtube","https://www.youtube.com/@GrowStreetCultivo"),
-            )
\ No newline at end of file
+            )
@@ -1,5 +1,8 @@
 import reflex as rx
 
+#REDIS_URL (ej: redis://localhost:6379) guarda el estado de las sesiones en redis
+#y permite correr varios workers (GUNICORN_WORKERS) o varias maquinas detras de
+#un balanceador sin sticky sessions, ver growstreet_web/serving/shared_state.py
 config = rx.Config(
     app_name="growstreet_web",
 )
\ No newline at end of file
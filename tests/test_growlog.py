@@ -0,0 +1,48 @@
+import pytest
+import reflex as rx
+import sqlmodel
+
+from growstreet_web.growlog import queries
+from growstreet_web.growlog.models import Reading
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def session():
+    engine = sqlmodel.create_engine("sqlite://")
+    rx.Model.metadata.create_all(engine, tables=[Reading.__table__])
+    with sqlmodel.Session(engine) as session:
+        yield session
+
+
+@pytest.mark.parametrize("range_days", [1, 7, 30, 90])
+def test_merged_reading_lands_in_downsampled_bucket(session, range_days):
+    start, end, width = queries.chart_window(range_days, NOW)
+    #Una lectura en la mitad del rango y otra al final
+    middle = start + (end - start) // 2
+    for ts in (middle, NOW):
+        session.add(Reading(grow = "g", plant = "p", ts = ts, ph = 6.0))
+    session.commit()
+
+    points = queries.downsample(session, "g", "ph", start, end, width = width)
+    changed = queries.merge_readings(points, [(middle, 7.0), (NOW, 5.0)], start, width)
+
+    #Las dos caen en puntos que ya existen, no se agregan puntos nuevos
+    assert [point["ts"] for point in changed] == [point["ts"] for point in points]
+    assert [point["count"] for point in changed] == [2, 2]
+    assert changed[0]["max"] == 7.0
+    assert changed[1]["min"] == 5.0
+
+
+def test_merge_matches_fresh_downsample(session):
+    start, end, width = queries.chart_window(7, NOW)
+    session.add(Reading(grow = "g", plant = "p", ts = NOW - 100, ph = 6.0))
+    session.commit()
+    points = queries.downsample(session, "g", "ph", start, end, width = width)
+
+    session.add(Reading(grow = "g", plant = "p", ts = NOW - 50, ph = 6.4))
+    session.commit()
+    merged = queries.merge_readings(points, [(NOW - 50, 6.4)], start, width)
+
+    assert merged == queries.downsample(session, "g", "ph", start, end, width = width)
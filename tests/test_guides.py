@@ -0,0 +1,23 @@
+import pytest
+
+from growstreet_web.guides.loader import load_guides
+
+
+def write_guide(directory, name, front_matter = ""):
+    (directory / name).write_text(f"---\ntitle: Guia\n{front_matter}---\nTexto\n", encoding="utf-8")
+
+
+def test_route_is_slugified(tmp_path):
+    write_guide(tmp_path, "Floración Temprana.md")
+    write_guide(tmp_path, "otra.md", "slug: Cosecha y Curado\n")
+    assert sorted(guide.route for guide in load_guides(tmp_path)) == [
+        "/guias/cosecha-y-curado",
+        "/guias/floracion-temprana",
+    ]
+
+
+def test_duplicate_routes_fail(tmp_path):
+    write_guide(tmp_path, "Floracion.md")
+    write_guide(tmp_path, "floracion.md")
+    with pytest.raises(ValueError, match="/guias/floracion"):
+        load_guides(tmp_path)
@@ -0,0 +1,26 @@
+import pytest
+
+from growstreet_web.build.static_export import unwrap_lazy_sections
+
+
+def test_unwrap_lazy_section():
+    html = '<div data-lazy-section="" style="width:100%"><noscript><p>Footer</p></noscript></div>'
+    assert unwrap_lazy_sections(html) == '<div data-lazy-section="" style="width:100%"><p>Footer</p></div>'
+
+
+def test_unwrap_nested_lazy_sections():
+    html = (
+        '<div data-lazy-section=""><noscript><p>A</p>'
+        '<div data-lazy-section=""><noscript><p>B</p></noscript></div>'
+        '<p>C</p><noscript><img src="x.png"/></noscript></noscript></div><p>D</p>'
+    )
+    assert unwrap_lazy_sections(html) == (
+        '<div data-lazy-section=""><p>A</p>'
+        '<div data-lazy-section=""><p>B</p></div>'
+        '<p>C</p><noscript><img src="x.png"/></noscript></div><p>D</p>'
+    )
+
+
+def test_unclosed_lazy_section_fails():
+    with pytest.raises(ValueError):
+        unwrap_lazy_sections('<div data-lazy-section=""><noscript><p>A</p></div>')